@@ -4,6 +4,14 @@ __version__ = "0.1.0"
 __author__ = "SAFE-MCP Scanner Team"
 __license__ = "MIT"
 
-from .scanner import Scanner
+from typing import Any
 
-__all__ = ["Scanner"]
\ No newline at end of file
+__all__ = ["Scanner"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the scanner lazily so the CLI can start without loading techniques
+    if name == "Scanner":
+        from .scanner import Scanner
+        return Scanner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
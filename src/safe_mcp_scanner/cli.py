@@ -1,15 +1,15 @@
 """Command-line interface for the SAFE-MCP Scanner."""
 
+import logging
 import sys
 from pathlib import Path
 from typing import Optional, List
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .scanner import Scanner
 from .config import Config, load_config
+from .serialization import dumps_json
 
 
 console = Console()
@@ -48,6 +48,14 @@ def cli(ctx: click.Context, config: Optional[Path], verbose: bool, quiet: bool)
         ctx.obj["log_level"] = "DEBUG"
     else:
         ctx.obj["log_level"] = "INFO"
+    
+    # Scanner warnings go to stderr so they never mix with reports on stdout
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    logger = logging.getLogger("safe_mcp_scanner")
+    logger.handlers = [handler]
+    logger.setLevel(ctx.obj["log_level"])
+    logger.propagate = False
 
 
 @cli.command()
@@ -92,6 +100,17 @@ def cli(ctx: click.Context, config: Optional[Path], verbose: bool, quiet: bool)
     type=click.Choice(["any", "high", "critical"], case_sensitive=False),
     help="Exit with non-zero code on specified severity levels",
 )
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=0),
+    help="Number of worker processes (0 for one per CPU)",
+)
+@click.option(
+    "--walk-threads",
+    type=click.IntRange(min=1),
+    help="Number of threads listing directories (helps on network filesystems)",
+)
 @click.option(
     "--no-progress",
     is_flag=True,
@@ -108,6 +127,8 @@ def scan(
     include: List[str],
     exclude: List[str],
     fail_on: Optional[str],
+    workers: Optional[int],
+    walk_threads: Optional[int],
     no_progress: bool,
 ) -> None:
     """Scan a directory or file for MCP security vulnerabilities.
@@ -127,6 +148,13 @@ def scan(
         config.exclude_patterns = list(exclude)
     if fail_on:
         config.fail_on_severity = fail_on
+    if workers is not None:
+        config.scan.workers = workers
+    if walk_threads is not None:
+        config.scan.walk_threads = walk_threads
+    
+    # Deferred so --help, --version and other commands don't pay for it
+    from .scanner import OUTPUT_BUFFER_SIZE, Scanner
     
     # Initialize scanner
     scanner = Scanner(config)
@@ -137,30 +165,51 @@ def scan(
         show_progress = not no_progress and ctx.obj["log_level"] == "INFO" and (output or format == "text")
         
         if show_progress:
+            from rich.progress import (
+                BarColumn,
+                MofNCompleteColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+            )
+            
+            # Redraw only when the scanner reports a batch, so no refresh
+            # thread runs alongside the scan
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
                 console=console,
+                auto_refresh=False,
             ) as progress:
                 task = progress.add_task("Scanning for vulnerabilities...", total=None)
-                results = scanner.scan(path)
-                progress.update(task, completed=True)
+                
+                def report_progress(completed: int, total: int) -> None:
+                    progress.update(task, completed=completed, total=total, refresh=True)
+                
+                results = scanner.scan(path, progress_callback=report_progress)
         else:
             results = scanner.scan(path)
         
-        # Generate output
-        output_content = scanner.format_results(results, format)
-        
-        # Write output
+        # Generate and write output
         if output:
-            output.write_text(output_content)
+            with output.open("wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+                scanner.write_results(results, format, stream)
             console.print(f"[green]Results written to {output}[/green]")
-        else:
-            # For JSON/SARIF, output directly without rich formatting
-            if format in ["json", "sarif"]:
-                click.echo(output_content)
+        elif format in ["json", "sarif"]:
+            # Write the encoded report straight to stdout, without rich
+            # formatting or a decode/re-encode through the text layer
+            stdout_buffer = getattr(sys.stdout, "buffer", None)
+            if stdout_buffer is not None:
+                sys.stdout.flush()
+                scanner.write_results(results, format, stdout_buffer)
+                stdout_buffer.write(b"\n")
+                stdout_buffer.flush()
             else:
-                console.print(output_content)
+                click.echo(scanner.format_results(results, format))
+        else:
+            console.print(scanner.format_results(results, format))
         
         # Handle exit codes
         if config.fail_on_severity and results.has_findings_at_severity(config.fail_on_severity):
@@ -191,8 +240,10 @@ def info(ctx: click.Context, list_techniques: bool, show_config: bool) -> None:
     config: Config = ctx.obj["config"]
     
     if list_techniques:
-        scanner = Scanner(config)
-        techniques = scanner.get_available_techniques()
+        # Only the technique catalog is needed, not a full Scanner
+        from .technique_loader import TechniqueLoader
+        
+        techniques = TechniqueLoader(config).load_techniques()
         
         console.print("[bold]Available SAFE-MCP Techniques:[/bold]")
         for technique_id, technique in techniques.items():
@@ -202,7 +253,7 @@ def info(ctx: click.Context, list_techniques: bool, show_config: bool) -> None:
     
     if show_config:
         console.print("[bold]Current Configuration:[/bold]")
-        console.print(config.model_dump_json(indent=2))
+        console.print(dumps_json(config.model_dump(mode="json")).decode("utf-8"))
 
 
 @cli.command()
@@ -227,7 +278,7 @@ def init_config(config_path: Path, force: bool) -> None:
     
     # Write to file
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(default_config.model_dump_json(indent=2))
+    config_path.write_bytes(dumps_json(default_config.model_dump(mode="json")))
     
     console.print(f"[green]Configuration file created: {config_path}[/green]")
 
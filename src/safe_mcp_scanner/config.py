@@ -1,22 +1,71 @@
 """Configuration management for the SAFE-MCP Scanner."""
 
+import copy
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-import yaml
 from pydantic import BaseModel, Field, ConfigDict, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    EnvSettingsSource,
+    SettingsConfigDict,
+)
 
+from . import __version__
+from .path_patterns import PathFilters, compile_path_filters
+from .serialization import dumps_compact_json, loads_json
 
-class TechniqueConfig(BaseModel):
-    """Configuration for individual SAFE-MCP techniques."""
+
+# Severities accepted for techniques and findings
+_TECHNIQUE_SEVERITIES = frozenset({"low", "medium", "high", "critical"})
+
+
+@dataclass(frozen=True)
+class TechniqueConfig:
+    """Configuration for individual SAFE-MCP techniques.
+    
+    A plain dataclass because it is looked up for every scanned file. It is
+    immutable, pattern lists included, since instances such as the default
+    are shared; fields are validated on construction.
+    """
     
     enabled: bool = True
-    severity: str = Field(default="medium", pattern="^(low|medium|high|critical)$")
-    confidence_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
-    custom_patterns: List[str] = Field(default_factory=list)
-    exclude_patterns: List[str] = Field(default_factory=list)
+    severity: str = "medium"
+    confidence_threshold: float = 0.7
+    custom_patterns: Tuple[str, ...] = ()
+    exclude_patterns: Tuple[str, ...] = ()
+    
+    def __post_init__(self) -> None:
+        if not isinstance(self.enabled, bool):
+            raise ValueError(f"enabled must be a boolean, got {self.enabled!r}")
+        if self.severity not in _TECHNIQUE_SEVERITIES:
+            raise ValueError(
+                f"severity must be one of low, medium, high, critical, got {self.severity!r}"
+            )
+        if (
+            isinstance(self.confidence_threshold, bool)
+            or not isinstance(self.confidence_threshold, (int, float))
+            or not 0.0 <= self.confidence_threshold <= 1.0
+        ):
+            raise ValueError(
+                f"confidence_threshold must be a number between 0.0 and 1.0, "
+                f"got {self.confidence_threshold!r}"
+            )
+        for name in ("custom_patterns", "exclude_patterns"):
+            patterns = getattr(self, name)
+            if isinstance(patterns, str) or not all(
+                isinstance(pattern, str) for pattern in patterns
+            ):
+                raise ValueError(f"{name} must be a list of strings, got {patterns!r}")
+            object.__setattr__(self, name, tuple(patterns))
+
+
+# Shared default for techniques without explicit configuration
+_DEFAULT_TECHNIQUE_CONFIG = TechniqueConfig()
 
 
 class ScanConfig(BaseModel):
@@ -33,6 +82,13 @@ class ScanConfig(BaseModel):
         "**/venv/**", "**/env/**", "**/.env/**"
     ])
     timeout_seconds: Optional[int] = Field(default=300)  # 5 minutes
+    workers: int = Field(default=1, ge=0)  # 0 uses one process per CPU
+    # Threads listing directories concurrently; helps on high-latency filesystems
+    walk_threads: int = Field(default=1, ge=1)
+    # Leading bytes checked for NULs and control characters to skip binary files
+    binary_sniff_bytes: int = Field(default=4096, ge=1)
+    # auto uses RE2 for content patterns when google-re2 is installed
+    regex_engine: str = Field(default="auto", pattern="^(auto|re|re2)$")
 
 
 class OutputConfig(BaseModel):
@@ -50,6 +106,8 @@ class Config(BaseSettings):
     
     model_config = SettingsConfigDict(
         env_prefix="SAFE_MCP_",
+        # Nested settings such as SAFE_MCP_SCAN__WORKERS
+        env_nested_delimiter="__",
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
@@ -70,6 +128,28 @@ class Config(BaseSettings):
     plugin_directories: List[Path] = Field(default_factory=list)
     custom_rules: List[Path] = Field(default_factory=list)
     
+    # Snapshot of SAFE_MCP_* environment variables and .env values
+    _env_snapshot: ClassVar[Optional[Dict[str, Any]]] = None
+    
+    @classmethod
+    def env_settings(cls) -> Dict[str, Any]:
+        """Get settings from the environment, reading it on first use only."""
+        if cls._env_snapshot is None:
+            cls.refresh_env()
+        return copy.deepcopy(cls._env_snapshot)
+    
+    @classmethod
+    def refresh_env(cls) -> None:
+        """Re-read environment variables and the .env file.
+        
+        Call this after changing SAFE_MCP_* variables in a running process.
+        """
+        dotenv_values = DotEnvSettingsSource(cls)()
+        env_values = EnvSettingsSource(cls)()
+        # Environment variables take priority over the .env file
+        cls._env_snapshot = merge_configs(dotenv_values, env_values)
+        _CONFIG_CACHE.clear()
+    
     @field_validator("plugin_directories", "custom_rules", mode="before")
     @classmethod
     def validate_paths(cls, v: Any) -> List[Path]:
@@ -97,7 +177,7 @@ class Config(BaseSettings):
     
     def get_technique_config(self, technique_id: str) -> TechniqueConfig:
         """Get configuration for a specific technique."""
-        return self.techniques.get(technique_id, TechniqueConfig())
+        return self.techniques.get(technique_id, _DEFAULT_TECHNIQUE_CONFIG)
     
     def is_technique_enabled(self, technique_id: str) -> bool:
         """Check if a technique is enabled."""
@@ -105,120 +185,254 @@ class Config(BaseSettings):
             return technique_id in self.enabled_techniques
         return technique_id not in self.disabled_techniques
     
+    def model_post_init(self, __context: Any) -> None:
+        """Precompile the file filters for the configured patterns."""
+        self.path_filters()
+    
+    def path_filters(self) -> PathFilters:
+        """Get compiled filters for the current include/exclude patterns."""
+        return compile_path_filters(
+            tuple(self.scan.include_patterns), tuple(self.scan.exclude_patterns)
+        )
+    
     def should_scan_file(self, file_path: Path) -> bool:
         """Check if a file should be scanned based on patterns."""
-        import fnmatch
-        from pathlib import PurePath
-        
-        # Convert to string for pattern matching
-        path_str = str(file_path)
-        pure_path = PurePath(file_path)
-        
-        # Check exclude patterns first
-        for pattern in self.scan.exclude_patterns:
-            # Handle different pattern types
-            if "**" in pattern:
-                # For patterns like **/node_modules/**, check if the path contains the directory
-                if "/**" in pattern:
-                    # Extract the directory name (e.g., "node_modules" from "**/node_modules/**")
-                    parts = pattern.split("/")
-                    for i, part in enumerate(parts):
-                        if part and part != "**":
-                            # Check if this directory appears in the path
-                            if f"/{part}/" in f"/{path_str}/" or path_str.startswith(f"{part}/") or path_str.endswith(f"/{part}"):
-                                return False
-                else:
-                    # Pattern like **/*.py - check suffix
-                    suffix = pattern.replace("**/", "")
-                    if fnmatch.fnmatch(path_str.split("/")[-1], suffix):
-                        return False
-            elif pure_path.match(pattern):
-                return False
-        
-        # Check include patterns
-        for pattern in self.scan.include_patterns:
-            if "**" in pattern:
-                # Pattern like **/*.py - check file extension
-                suffix = pattern.replace("**/", "")
-                if pure_path.match(suffix):
-                    return True
-            elif pure_path.match(pattern):
-                return True
+        return self.should_scan_path_str(file_path.as_posix())
+    
+    def should_scan_path_str(self, path_str: str) -> bool:
+        """Check if a file should be scanned, given its path as a POSIX string.
         
-        return False
+        Lets directory walkers filter raw path strings without building a
+        Path object for every candidate. Walkers checking many files should
+        resolve path_filters() once and call its matches() directly.
+        """
+        return self.path_filters().matches(path_str)
+
+
+# Candidate config file names, most likely first
+_PROJECT_CONFIG_NAMES = (
+    ".safe-mcp-scanner.yaml",
+    ".safe-mcp-scanner.yml",
+    "safe-mcp-scanner.yaml",
+    "safe-mcp-scanner.yml",
+)
+_USER_CONFIG_NAMES = ("config.yaml", "config.yml")
+_SYSTEM_CONFIG_DIR = "/etc/safe-mcp-scanner"
+
+
+def _first_existing(directory: str, names: Tuple[str, ...]) -> Optional[Path]:
+    """Return the first of the candidate file names present in a directory."""
+    for name in names:
+        candidate = os.path.join(directory, name)
+        if os.path.isfile(candidate):
+            return Path(candidate)
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _find_config_files_cached(cwd: str, home: str) -> Tuple[Path, ...]:
+    """Probe the config hierarchy for a given working and home directory."""
+    user_config_dir = os.path.join(home, ".config", "safe-mcp-scanner")
+    candidates = (
+        # 1. Project configuration
+        _first_existing(cwd, _PROJECT_CONFIG_NAMES),
+        # 2. User configuration
+        _first_existing(user_config_dir, _USER_CONFIG_NAMES),
+        # 3. System configuration
+        _first_existing(_SYSTEM_CONFIG_DIR, _USER_CONFIG_NAMES),
+    )
+    return tuple(path for path in candidates if path is not None)
 
 
 def find_config_files() -> List[Path]:
-    """Find configuration files following the hierarchy."""
-    config_files = []
-    
-    # 1. Project configuration
-    project_configs = [
-        Path.cwd() / ".safe-mcp-scanner.yaml",
-        Path.cwd() / ".safe-mcp-scanner.yml",
-        Path.cwd() / "safe-mcp-scanner.yaml",
-        Path.cwd() / "safe-mcp-scanner.yml",
-    ]
-    for config_file in project_configs:
-        if config_file.exists():
-            config_files.append(config_file)
-            break
-    
-    # 2. User configuration
-    user_config_dir = Path.home() / ".config" / "safe-mcp-scanner"
-    user_configs = [
-        user_config_dir / "config.yaml",
-        user_config_dir / "config.yml",
-    ]
-    for config_file in user_configs:
-        if config_file.exists():
-            config_files.append(config_file)
-            break
-    
-    # 3. System configuration
-    system_configs = [
-        Path("/etc/safe-mcp-scanner/config.yaml"),
-        Path("/etc/safe-mcp-scanner/config.yml"),
-    ]
-    for config_file in system_configs:
-        if config_file.exists():
-            config_files.append(config_file)
-            break
-    
-    return config_files
+    """Find configuration files following the hierarchy.
+    
+    If ``SAFE_MCP_CONFIG`` is set it names the only config file and no
+    discovery is done. Probe results are cached per working/home directory
+    for the life of the process.
+    """
+    explicit_config = os.environ.get("SAFE_MCP_CONFIG")
+    if explicit_config:
+        return [Path(explicit_config)]
+    
+    return list(_find_config_files_cached(os.getcwd(), os.path.expanduser("~")))
 
 
-def load_yaml_config(config_path: Path) -> Dict[str, Any]:
-    """Load configuration from a YAML file."""
+@functools.lru_cache(maxsize=None)
+def _yaml_loader_and_dumper() -> Tuple[Any, Any]:
+    """Resolve the YAML loader/dumper, importing PyYAML on first use.
+    
+    Prefers the libyaml-backed C implementations when available; the
+    pure-Python ones are roughly an order of magnitude slower.
+    """
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+        return CSafeLoader, CSafeDumper
+    except ImportError:  # pragma: no cover - depends on libyaml availability
+        from yaml import SafeDumper, SafeLoader
+        return SafeLoader, SafeDumper
+
+
+def _file_cache_key(path: Path) -> Tuple[str, int, int]:
+    """Build a cache key that changes whenever the file is edited."""
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; keyed on mtime and size so edits invalidate the entry."""
+    import yaml
+    
+    loader, _ = _yaml_loader_and_dumper()
+    config_path = Path(path_str)
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=loader) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in config file {config_path}: {e}")
     except Exception as e:
         raise ValueError(f"Error reading config file {config_path}: {e}")
 
 
+def load_yaml_config(config_path: Path) -> Dict[str, Any]:
+    """Load configuration from a YAML file."""
+    try:
+        cache_key = _file_cache_key(config_path)
+    except OSError as e:
+        raise ValueError(f"Error reading config file {config_path}: {e}")
+    
+    # Hand out a copy so callers can't mutate the cached document
+    return copy.deepcopy(_load_yaml_cached(*cache_key))
+
+
 def merge_configs(*configs: Dict[str, Any]) -> Dict[str, Any]:
     """Merge multiple configuration dictionaries.
     
-    Later configs override earlier ones. Nested dictionaries are merged recursively.
+    Later configs override earlier ones. Sections (e.g. ``scan``) are merged
+    key by key, and so are the per-technique entries under ``techniques``;
+    the schema has no deeper nesting, so anything below is replaced whole.
     """
-    result = {}
+    result: Dict[str, Any] = {}
     
     for config in configs:
         if not config:
             continue
             
         for key, value in config.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = merge_configs(result[key], value)
-            else:
+            current = result.get(key)
+            if not (isinstance(current, dict) and isinstance(value, dict)):
                 result[key] = value
+                continue
+            
+            merged = {**current, **value}
+            for sub_key, sub_value in value.items():
+                sub_current = current.get(sub_key)
+                if isinstance(sub_current, dict) and isinstance(sub_value, dict):
+                    merged[sub_key] = {**sub_current, **sub_value}
+            result[key] = merged
     
     return result
 
 
+# Validated configs keyed on the (mtime, size) of each merged config file
+_CONFIG_CACHE: Dict[Tuple[Any, ...], Config] = {}
+
+
+def _config_state(config: Config) -> Dict[str, Any]:
+    """Capture a validated config as JSON-compatible data plus its set fields."""
+    return {
+        "data": config.model_dump(mode="json"),
+        "fields_set": {
+            "config": sorted(config.model_fields_set),
+            "scan": sorted(config.scan.model_fields_set),
+            "output": sorted(config.output.model_fields_set),
+        },
+    }
+
+
+def _config_from_state(state: Dict[str, Any]) -> Config:
+    """Rebuild a config captured by _config_state without re-running validation.
+    
+    The state holds already-validated values, so model_construct() can skip
+    the validators; callers must pass state they own, as it is not copied.
+    """
+    data = dict(state["data"])
+    fields_set = state["fields_set"]
+    data["scan"] = ScanConfig.model_construct(set(fields_set["scan"]), **data["scan"])
+    data["output"] = OutputConfig.model_construct(
+        set(fields_set["output"]), **data["output"]
+    )
+    data["techniques"] = {
+        technique_id: TechniqueConfig(**settings)
+        for technique_id, settings in data["techniques"].items()
+    }
+    data["plugin_directories"] = [Path(path) for path in data["plugin_directories"]]
+    data["custom_rules"] = [Path(path) for path in data["custom_rules"]]
+    return Config.model_construct(set(fields_set["config"]), **data)
+
+
+def _clone_config(config: Config) -> Config:
+    """Copy an already-validated config without re-running validation."""
+    # model_dump() hands back fresh containers, so nothing mutable is shared
+    return _config_from_state(_config_state(config))
+
+
+def _config_cache_file() -> Path:
+    """Location of the persistent validated-config cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home, "safe-mcp-scanner", "config-cache.json")
+
+
+def _restore_fields_set(model: BaseModel, fields_set: List[str]) -> BaseModel:
+    """Rebuild a validated model so only the recorded fields count as set."""
+    names = set(fields_set)
+    unknown = names - set(type(model).model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {sorted(unknown)}")
+    return type(model).model_construct(names, **dict(model))
+
+
+def _read_disk_cache(cache_key: Dict[str, Any]) -> Optional[Config]:
+    """Load the cached config if it was built from the same inputs.
+    
+    The cache file lives outside our control and may be corrupt or hand-edited,
+    so its state is validated again rather than trusted like _config_from_state.
+    """
+    try:
+        entry = loads_json(_config_cache_file().read_bytes())
+        if entry.get("key") != cache_key:
+            return None
+        state = entry["state"]
+        fields_set = state["fields_set"]
+        config = Config.model_validate(state["data"])
+        config.scan = _restore_fields_set(config.scan, fields_set["scan"])
+        config.output = _restore_fields_set(config.output, fields_set["output"])
+        return _restore_fields_set(config, fields_set["config"])
+    except Exception:
+        # Missing, stale-format, corrupt or invalid caches are simply rebuilt
+        return None
+
+
+def _write_disk_cache(cache_key: Dict[str, Any], config: Config) -> None:
+    """Persist a validated config for later processes; failures are ignored."""
+    cache_file = _config_cache_file()
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_bytes(
+            dumps_compact_json({"key": cache_key, "state": _config_state(config)})
+        )
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
+
 def load_config(config_path: Optional[Path] = None) -> Config:
     """Load configuration following the hierarchy.
     
@@ -229,10 +443,12 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     4. User configuration (~/.config/safe-mcp-scanner/)
     5. System configuration (/etc/safe-mcp-scanner/)
     6. Default built-in configuration
-    """
-    # Start with default configuration
-    config_data = {}
     
+    Environment variables are read once per process (see Config.refresh_env).
+    Results are cached per set of config files (by mtime and size), in memory
+    and in the user cache directory so later runs skip YAML parsing and
+    validation; each call returns an independent copy.
+    """
     # Load configuration files (lowest to highest priority)
     if config_path is None:
         config_files = find_config_files()
@@ -240,16 +456,50 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     else:
         config_files = [config_path]
     
+    try:
+        cache_key: Optional[Tuple[Any, ...]] = tuple(
+            _file_cache_key(config_file) for config_file in config_files
+        )
+    except OSError:
+        # Let load_yaml_config report the unreadable file below
+        cache_key = None
+    
+    if cache_key is not None and cache_key in _CONFIG_CACHE:
+        return _clone_config(_CONFIG_CACHE[cache_key])
+    
+    disk_cache_key: Optional[Dict[str, Any]] = None
+    if cache_key is not None:
+        disk_cache_key = {
+            "version": __version__,
+            "files": [list(file_key) for file_key in cache_key],
+            "env": Config.env_settings(),
+        }
+        cached_config = _read_disk_cache(disk_cache_key)
+        if cached_config is not None:
+            _CONFIG_CACHE[cache_key] = cached_config
+            return _clone_config(cached_config)
+    
+    # Start with default configuration
+    config_data = {}
+    
     # Merge configuration files
     for config_file in config_files:
         file_config = load_yaml_config(config_file)
         config_data = merge_configs(config_data, file_config)
     
-    # Create Config instance (which will also load environment variables)
+    # Validate against the environment snapshot rather than letting
+    # pydantic-settings rescan os.environ; file values win, as with Config(**data)
     try:
-        return Config(**config_data)
+        config_data = merge_configs(Config.env_settings(), config_data)
+        config = Config.model_validate(config_data)
     except Exception as e:
         raise ValueError(f"Invalid configuration: {e}")
+    
+    if cache_key is not None and disk_cache_key is not None:
+        _CONFIG_CACHE[cache_key] = config
+        _write_disk_cache(disk_cache_key, config)
+        return _clone_config(config)
+    return config
 
 
 def create_default_config_file(config_path: Path) -> None:
@@ -284,6 +534,15 @@ def create_default_config_file(config_path: Path) -> None:
         }
     }
     
+    import yaml
+    
+    _, dumper = _yaml_loader_and_dumper()
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(default_config, f, default_flow_style=False, indent=2)
\ No newline at end of file
+        yaml.dump(
+            default_config,
+            f,
+            Dumper=dumper,
+            default_flow_style=False,
+            indent=2,
+        )
\ No newline at end of file
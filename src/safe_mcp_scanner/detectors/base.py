@@ -1,13 +1,82 @@
 """Base class for detection engines."""
 
+import bisect
+import codecs
+import os
 from abc import ABC, abstractmethod
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional, Tuple
 
 from ..techniques.base import Finding
 from ..config import Config
 
 
+# Tried in order; latin-1 accepts any byte sequence
+_FALLBACK_ENCODINGS = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes, falling back through the supported encodings.
+    
+    Newlines are normalized the same way as text-mode reads.
+    """
+    if data.startswith(codecs.BOM_UTF8):
+        encodings = ["utf-8-sig"] + _FALLBACK_ENCODINGS
+    else:
+        encodings = _FALLBACK_ENCODINGS
+    
+    for encoding in encodings:
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+    
+    raise ValueError("Could not decode file with any supported encoding")
+
+
+def read_file_bytes(file_path: Path, max_file_size: int) -> bytes:
+    """Read a file's bytes, refusing files larger than max_file_size.
+    
+    Raises:
+        ValueError: If the file is too large or can't be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            # read(n) allocates n bytes up front, so size the read from the
+            # file rather than the limit; read on past the reported size, up
+            # to one byte over the limit, in case it grew or reports 0
+            expected_size = min(os.fstat(f.fileno()).st_size, max_file_size)
+            data = f.read(expected_size + 1)
+            if len(data) > expected_size:
+                data += f.read(max_file_size + 1 - len(data))
+    except Exception as e:
+        raise ValueError(f"Error reading file {file_path}: {e}")
+    
+    if len(data) > max_file_size:
+        raise ValueError(
+            f"Error reading file {file_path}: File too large: more than {max_file_size} bytes"
+        )
+    return data
+
+
+def compute_line_starts(content: str) -> List[int]:
+    """Get the offset at which each line of the content starts."""
+    # Each line starts one past the end of the previous one; map/accumulate
+    # keep the whole computation in C
+    line_lengths = map(len, content.split("\n"))
+    return list(accumulate(map((1).__add__, line_lengths), initial=0))[:-1]
+
+
+def offset_to_line_column(line_starts: List[int], offset: int) -> Tuple[int, int]:
+    """Convert a content offset into 1-based (line, column) numbers."""
+    line_index = bisect.bisect_right(line_starts, offset) - 1
+    return line_index + 1, offset - line_starts[line_index] + 1
+
+
 class BaseDetector(ABC):
     """Abstract base class for detection engines."""
     
@@ -46,23 +115,9 @@ class BaseDetector(ABC):
     
     def read_file_safely(self, file_path: Path) -> str:
         """Safely read a file with size limits and encoding detection."""
+        data = read_file_bytes(file_path, self.config.scan.max_file_size)
         try:
-            # Check file size
-            file_size = file_path.stat().st_size
-            if file_size > self.config.scan.max_file_size:
-                raise ValueError(f"File too large: {file_size} bytes")
-            
-            # Try to read with UTF-8 first, fall back to other encodings
-            encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
-            
-            for encoding in encodings:
-                try:
-                    return file_path.read_text(encoding=encoding)
-                except UnicodeDecodeError:
-                    continue
-            
-            raise ValueError("Could not decode file with any supported encoding")
-            
+            return _decode_text(data)
         except Exception as e:
             raise ValueError(f"Error reading file {file_path}: {e}")
     
@@ -70,17 +125,28 @@ class BaseDetector(ABC):
         self, 
         content: str, 
         line_number: int, 
-        context_lines: int = 5
+        context_lines: int = 5,
+        line_starts: Optional[List[int]] = None
     ) -> str:
-        """Extract source code context around a specific line."""
-        lines = content.splitlines()
+        """Extract source code context around a specific line.
+        
+        Lines are sliced out of the content, so the file is never split into
+        a list of lines. Callers extracting several contexts from the same
+        content should pass ``line_starts`` from compute_line_starts().
+        """
+        if line_starts is None:
+            line_starts = compute_line_starts(content)
+        
+        # A trailing newline ends the last line rather than starting a new one
+        total_lines = len(line_starts) - (1 if content.endswith("\n") else 0)
         
         start_line = max(0, line_number - context_lines - 1)
-        end_line = min(len(lines), line_number + context_lines)
+        end_line = min(total_lines, line_number + context_lines)
         
         context_lines_list = []
         for i in range(start_line, end_line):
+            line_end = line_starts[i + 1] - 1 if i + 1 < len(line_starts) else len(content)
             marker = ">>> " if i == line_number - 1 else "    "
-            context_lines_list.append(f"{marker}{i + 1:4d}: {lines[i]}")
+            context_lines_list.append(f"{marker}{i + 1:4d}: {content[line_starts[i]:line_end]}")
         
-        return "\n".join(context_lines_list)
\ No newline at end of file
+        return "\n".join(context_lines_list)
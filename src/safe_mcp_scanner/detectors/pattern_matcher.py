@@ -1,11 +1,184 @@
 """Pattern-based detection engine for security issues."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Pattern
+from typing import List, Dict, Any, Optional, Pattern, Tuple
 
 from ..techniques.base import Finding
-from .base import BaseDetector
+from .base import BaseDetector, _decode_text, compute_line_starts, offset_to_line_column
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - google-re2 is an optional speedup
+    re2 = None
+
+
+# Default regex flags for patterns that don't specify their own. Patterns
+# target ASCII source text, and ASCII-only \s, \w and case folding are
+# cheaper to test; patterns needing Unicode classes should set their own flags
+DEFAULT_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE | re.ASCII
+
+# Control bytes other than whitespace; anything else counts as text, which
+# includes UTF-8 multi-byte sequences and legacy 8-bit encodings
+_NON_TEXT_BYTES = bytes(
+    byte for byte in range(256)
+    if (byte < 32 and byte not in b"\t\n\x0b\x0c\r") or byte == 127
+)
+
+# Extensions of binary formats, rejected without opening the file
+_BINARY_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".pdf",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".tar", ".jar", ".whl",
+    ".exe", ".dll", ".so", ".dylib", ".o", ".a", ".pyc", ".pyo", ".class",
+    ".wasm", ".woff", ".woff2", ".ttf", ".otf", ".mp3", ".mp4", ".sqlite",
+})
+
+# Leading bytes of common binary formats (ZIP, ELF, PNG, PDF, GIF, JPEG,
+# gzip, Java class / Mach-O fat binaries)
+_BINARY_MAGIC = (
+    b"PK\x03\x04", b"\x7fELF", b"\x89PNG", b"%PDF", b"GIF8", b"\xff\xd8\xff",
+    b"\x1f\x8b", b"\xca\xfe\xba\xbe",
+)
+
+# Backreferences depend on group numbering, so such patterns can't be combined
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Characters that case-insensitive matching pairs with ASCII letters but
+# that str.lower() leaves alone
+_CASE_FOLD_FIXES = str.maketrans({"\u017f": "s", "\u0131": "i"})
+
+# Escapes that consume more than one character after the backslash
+_MULTI_CHAR_ESCAPES = frozenset("xuUN0123456789")
+
+_BRACE_QUANTIFIER_RE = re.compile(r"\{\d*(?:,\d*)?\}")
+
+# Flags RE2 supports, as the inline flags that express them; its character
+# classes are ASCII-only anyway, so re.ASCII needs no inline flag
+_RE2_INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+_RE2_SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE | re.ASCII
+
+
+@lru_cache(maxsize=4096)
+def _required_literal(pattern: str, flags: int) -> str:
+    """Find the longest literal string every match of a regex must contain.
+    
+    Only literals outside groups are considered, so the result is
+    conservative: an empty string means no literal could be extracted.
+    For case-insensitive patterns the literal is lowercased.
+    """
+    if flags & re.VERBOSE or pattern.startswith("(?"):
+        return ""  # Whitespace or inline flags change what characters mean
+    
+    runs: List[str] = []
+    current: List[str] = []
+    depth = 0
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if escaped in _MULTI_CHAR_ESCAPES:
+                return ""
+            i += 2
+            if depth == 0 and escaped and not escaped.isalnum():
+                current.append(escaped)
+                continue
+        elif char == "[":
+            # Skip the whole character class, including any parentheses in it
+            i += 1
+            if pattern[i:i + 1] == "^":
+                i += 1
+            if pattern[i:i + 1] == "]":
+                i += 1
+            while i < n and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+        elif char == "(":
+            depth += 1
+            i += 1
+        elif char == ")":
+            depth -= 1
+            i += 1
+        elif depth > 0:
+            i += 1
+            continue
+        elif char == "|":
+            return ""  # Top-level alternatives have no common literal
+        elif char in "*?{+":
+            # The quantified character is optional, or repeated when +
+            if char != "+" and current:
+                current.pop()
+            if char == "{":
+                quantifier = _BRACE_QUANTIFIER_RE.match(pattern, i)
+                i = quantifier.end() if quantifier else i + 1
+            else:
+                i += 1
+        elif char in ".^$":
+            i += 1
+        else:
+            current.append(char)
+            i += 1
+            continue
+        
+        # Anything other than a literal character ends the current run
+        runs.append("".join(current))
+        current = []
+    
+    runs.append("".join(current))
+    literal = max(runs, key=len)
+    return literal.lower() if flags & re.IGNORECASE else literal
+
+
+@lru_cache(maxsize=4096)
+def _compile(pattern: str, flags: int, use_re2: bool = False) -> Pattern:
+    """Compile a regex, shared by all PatternMatcher instances.
+    
+    Unlike the re module's own cache, this one is large enough to hold every
+    technique pattern and evicts one entry at a time rather than clearing.
+    With use_re2, patterns RE2 can express are compiled with it, matching in
+    linear time; others (lookarounds, backreferences) fall back to re.
+    """
+    if use_re2 and re2 is not None and not flags & ~_RE2_SUPPORTED_FLAGS:
+        inline_flags = "".join(
+            letter for flag, letter in _RE2_INLINE_FLAGS.items() if flags & flag
+        )
+        try:
+            return re2.compile(f"(?{inline_flags}){pattern}" if inline_flags else pattern)
+        except Exception:
+            pass  # Not expressible in RE2; use the backtracking engine
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=256)
+def _compile_combined(
+    pattern_keys: Tuple[Tuple[str, int], ...], use_re2: bool = False
+) -> Optional[List[Pattern]]:
+    """Build alternations of (pattern, flags) pairs, one per distinct flag set.
+    
+    A search with these finds a match exactly when some individual pattern
+    would. Returns None when the patterns can't be combined safely.
+    """
+    by_flags: Dict[int, List[str]] = {}
+    for pattern_str, flags in pattern_keys:
+        if not pattern_str:
+            continue
+        try:
+            _compile(pattern_str, flags, use_re2)
+        except re.error:
+            continue  # Never matches anything
+        if _BACKREFERENCE_RE.search(pattern_str):
+            return None
+        by_flags.setdefault(flags, []).append(pattern_str)
+    
+    try:
+        return [
+            _compile("|".join(f"(?:{regex})" for regex in group), flags, use_re2)
+            for flags, group in by_flags.items()
+        ]
+    except re.error:
+        # e.g. duplicate group names or inline global flags
+        return None
 
 
 class PatternMatcher(BaseDetector):
@@ -13,7 +186,13 @@ class PatternMatcher(BaseDetector):
     
     def __init__(self, config) -> None:
         super().__init__(config)
-        self._compiled_patterns: Dict[str, Pattern] = {}
+        
+        # Techniques are instantiated without a config when registered
+        regex_engine = config.scan.regex_engine if config is not None else "auto"
+        if regex_engine == "re2" and re2 is None:
+            raise ValueError("regex_engine 're2' requires the google-re2 package")
+        self._use_re2 = regex_engine != "re" and re2 is not None
+        self._sniff_bytes = config.scan.binary_sniff_bytes if config is not None else 4096
     
     @property
     def name(self) -> str:
@@ -25,21 +204,35 @@ class PatternMatcher(BaseDetector):
     
     def can_analyze_file(self, file_path: Path) -> bool:
         """Check if this detector can analyze the given file."""
+        if file_path.suffix.lower() in _BINARY_EXTENSIONS:
+            return False
+        
         try:
             # Try to read a small portion to check if it's a text file
             with open(file_path, 'rb') as f:
-                sample = f.read(1024)
-                
-            # Simple heuristic: if we can decode as UTF-8 and it's mostly printable, it's text
-            try:
-                decoded = sample.decode('utf-8')
-                printable_ratio = sum(1 for c in decoded if c.isprintable() or c.isspace()) / len(decoded)
-                return printable_ratio > 0.7
-            except UnicodeDecodeError:
-                return False
-                
+                sample = f.read(self._sniff_bytes)
         except (IOError, OSError):
             return False
+        
+        return self._is_text_sample(sample)
+    
+    def can_analyze_bytes(self, file_path: Path, data: bytes) -> bool:
+        """Check if this detector can analyze a file, given its contents."""
+        if file_path.suffix.lower() in _BINARY_EXTENSIONS:
+            return False
+        
+        return self._is_text_sample(data[:self._sniff_bytes])
+    
+    def _is_text_sample(self, sample: bytes) -> bool:
+        """Check whether the first bytes of a file look like text."""
+        # Simple heuristic: no NUL bytes and mostly non-control bytes means text
+        if not sample:
+            return True
+        if sample.startswith(_BINARY_MAGIC) or b"\x00" in sample:
+            return False
+        
+        printable_ratio = len(sample.translate(None, _NON_TEXT_BYTES)) / len(sample)
+        return printable_ratio > 0.7
     
     def analyze_file(self, file_path: Path, patterns: List[Dict[str, Any]]) -> List[Finding]:
         """Analyze a file using the provided patterns.
@@ -52,26 +245,89 @@ class PatternMatcher(BaseDetector):
                 - severity: severity level
                 - message: finding message template
                 - confidence: confidence score
+                - flags: optional regex flags, default DEFAULT_PATTERN_FLAGS
                 
         Returns:
             List of security findings
         """
-        findings: List[Finding] = []
-        
         try:
             content = self.read_file_safely(file_path)
         except ValueError as e:
             # File too large or unreadable
+            return []
+        
+        return self.analyze_content(file_path, content, patterns)
+    
+    def analyze_bytes(
+        self, file_path: Path, data: bytes, patterns: List[Dict[str, Any]]
+    ) -> List[Finding]:
+        """Analyze a file's already-read bytes using the provided patterns.
+        
+        Args:
+            file_path: Path the bytes were read from
+            data: File contents
+            patterns: Pattern dictionaries, as for analyze_file()
+            
+        Returns:
+            List of security findings
+        """
+        try:
+            content = _decode_text(data)
+        except ValueError:
+            return []
+        
+        return self.analyze_content(file_path, content, patterns)
+    
+    def analyze_content(
+        self, file_path: Path, content: str, patterns: List[Dict[str, Any]]
+    ) -> List[Finding]:
+        """Analyze decoded file content using the provided patterns.
+        
+        Args:
+            file_path: Path the content was read from
+            content: Decoded text with normalized newlines
+            patterns: Pattern dictionaries, as for analyze_file()
+            
+        Returns:
+            List of security findings
+        """
+        findings: List[Finding] = []
+        
+        # One combined pass rules out files where no pattern can match,
+        # which is most files; otherwise each pattern is applied on its own
+        # so overlapping matches from different patterns are all reported
+        prefilters = self._get_combined_patterns(patterns)
+        if prefilters is not None and not any(
+            prefilter.search(content) for prefilter in prefilters
+        ):
             return findings
         
-        lines = content.splitlines()
+        # Filled in by the first match, so files where no pattern ends up
+        # matching never pay for indexing their lines
+        line_starts: List[int] = []
+        # Source context per line, shared by patterns matching the same line
+        source_contexts: Dict[int, str] = {}
+        folded_content: Optional[str] = None
         
         for pattern_dict in patterns:
+            # Skip patterns whose required literal text isn't in the file
+            flags = pattern_dict.get("flags", DEFAULT_PATTERN_FLAGS)
+            literal = _required_literal(pattern_dict.get("pattern", ""), flags)
+            if literal:
+                if flags & re.IGNORECASE:
+                    if folded_content is None:
+                        folded_content = content.lower().translate(_CASE_FOLD_FIXES)
+                    if literal not in folded_content:
+                        continue
+                elif literal not in content:
+                    continue
+            
             pattern_findings = self._apply_pattern(
                 file_path, 
                 content, 
-                lines, 
-                pattern_dict
+                line_starts, 
+                pattern_dict,
+                source_contexts
             )
             findings.extend(pattern_findings)
         
@@ -81,61 +337,77 @@ class PatternMatcher(BaseDetector):
         self, 
         file_path: Path, 
         content: str, 
-        lines: List[str], 
-        pattern_dict: Dict[str, Any]
+        line_starts: List[int], 
+        pattern_dict: Dict[str, Any],
+        source_contexts: Optional[Dict[int, str]] = None
     ) -> List[Finding]:
-        """Apply a single pattern to file content."""
+        """Apply a single pattern to file content.
+        
+        ``line_starts`` and ``source_contexts`` are shared between the
+        patterns applied to a file. ``line_starts`` is filled from the content
+        on the first match if empty, and ``source_contexts`` caches the
+        context extracted for each matched line.
+        """
+        if source_contexts is None:
+            source_contexts = {}
+        
         findings: List[Finding] = []
         
         pattern_str = pattern_dict.get("pattern", "")
-        if not pattern_str:
+        regex_pattern = self._get_compiled_pattern(pattern_dict)
+        if regex_pattern is None:
             return findings
         
-        # Compile pattern if not already cached
-        pattern_key = f"{pattern_str}:{pattern_dict.get('flags', 0)}"
-        if pattern_key not in self._compiled_patterns:
-            flags = pattern_dict.get("flags", re.IGNORECASE | re.MULTILINE)
-            try:
-                self._compiled_patterns[pattern_key] = re.compile(pattern_str, flags)
-            except re.error:
-                # Invalid regex pattern
-                return findings
-        
-        regex_pattern = self._compiled_patterns[pattern_key]
+        # Rule fields and lookups are the same for every match
+        technique_id: str = pattern_dict.get("technique_id", "UNKNOWN")
+        severity: str = pattern_dict.get("severity", "medium")
+        confidence: float = pattern_dict.get("confidence", 0.7)
+        has_message = "message" in pattern_dict
+        message: str = pattern_dict.get("message", "")
+        description: str = pattern_dict.get("description", "Security pattern detected")
+        recommendation: str = pattern_dict.get("recommendation", "Review the flagged code")
+        max_lines_context: int = self.config.output.max_lines_context
+        extract_source_context = self.extract_source_context
         
         # Search for matches
         for match in regex_pattern.finditer(content):
-            # Find line number
-            line_number = content[:match.start()].count('\n') + 1
+            if not line_starts:
+                line_starts.extend(compute_line_starts(content))
+            
+            matched_text = match.group()
+            groups = match.groups()
+            groupdict = match.groupdict()
             
-            # Calculate column number
-            line_start = content.rfind('\n', 0, match.start()) + 1
-            column_number = match.start() - line_start + 1
+            # Find line and column numbers
+            line_number, column_number = offset_to_line_column(line_starts, match.start())
             
             # Extract source context
-            source_context = self.extract_source_context(
-                content, 
-                line_number, 
-                self.config.output.max_lines_context
-            )
+            source_context = source_contexts.get(line_number)
+            if source_context is None:
+                source_context = source_contexts[line_number] = extract_source_context(
+                    content, 
+                    line_number, 
+                    max_lines_context,
+                    line_starts=line_starts
+                )
             
             # Create finding
             finding = Finding(
-                technique_id=pattern_dict.get("technique_id", "UNKNOWN"),
+                technique_id=technique_id,
                 file_path=file_path,
                 line_number=line_number,
                 column_number=column_number,
-                severity=pattern_dict.get("severity", "medium"),
-                confidence=pattern_dict.get("confidence", 0.7),
-                message=pattern_dict.get("message", f"Pattern match: {match.group()}"),
-                description=pattern_dict.get("description", "Security pattern detected"),
-                recommendation=pattern_dict.get("recommendation", "Review the flagged code"),
+                severity=severity,
+                confidence=confidence,
+                message=message if has_message else f"Pattern match: {matched_text}",
+                description=description,
+                recommendation=recommendation,
                 source_code=source_context,
                 metadata={
-                    "matched_text": match.group(),
+                    "matched_text": matched_text,
                     "pattern": pattern_str,
-                    "groups": match.groups() if match.groups() else [],
-                    "groupdict": match.groupdict() if match.groupdict() else {}
+                    "groups": groups if groups else [],
+                    "groupdict": groupdict if groupdict else {}
                 }
             )
             
@@ -143,6 +415,38 @@ class PatternMatcher(BaseDetector):
         
         return findings
     
+    def _get_compiled_pattern(self, pattern_dict: Dict[str, Any]) -> Optional[Pattern]:
+        """Compile a pattern dictionary's regex, caching the result.
+        
+        Returns None for empty or invalid patterns.
+        """
+        pattern_str = pattern_dict.get("pattern", "")
+        if not pattern_str:
+            return None
+        
+        flags = pattern_dict.get("flags", DEFAULT_PATTERN_FLAGS)
+        try:
+            return _compile(pattern_str, flags, self._use_re2)
+        except re.error:
+            # Invalid regex pattern
+            return None
+    
+    def _get_combined_patterns(
+        self, patterns: List[Dict[str, Any]]
+    ) -> Optional[List[Pattern]]:
+        """Get alternations of all patterns, one per distinct flag set.
+        
+        Returns None when the patterns can't be combined safely.
+        """
+        pattern_keys = tuple(
+            (
+                pattern_dict.get("pattern", ""),
+                pattern_dict.get("flags", DEFAULT_PATTERN_FLAGS),
+            )
+            for pattern_dict in patterns
+        )
+        return _compile_combined(pattern_keys, self._use_re2)
+    
     def create_command_injection_patterns(self) -> List[Dict[str, Any]]:
         """Create patterns for detecting command injection vulnerabilities."""
         return [
@@ -220,7 +524,9 @@ class PatternMatcher(BaseDetector):
         """Create patterns for detecting OAuth token theft."""
         return [
             {
-                "pattern": r"requests\.(?:get|post|put|patch|delete)\s*\([^)]*[\"']https?://[^/]*(?:evil|malicious|attacker)[^\"']*[\"']",
+                # Bounded argument span and a host that can't run past the
+                # closing quote keep backtracking linear on unclosed calls
+                "pattern": r"requests\.(?:get|post|put|patch|delete)\s*\([^)]{0,512}[\"']https?://[^/\"'\s]*(?:evil|malicious|attacker)[^\"']*[\"']",
                 "technique_id": "SAFE-T1201",
                 "severity": "critical",
                 "confidence": 0.9,
@@ -1,10 +1,13 @@
 """File discovery and filtering for MCP server scanning."""
 
-import fnmatch
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Iterator
+from typing import Dict, List, Optional, Set, Iterator, Tuple
 
 from .config import Config
+from .path_patterns import compile_union, path_match_regex
 
 
 class FileDiscovery:
@@ -42,8 +45,19 @@ class FileDiscovery:
         "**/kubernetes/**/*.yml",
     ]
     
+    # Each pattern list as one regex with PurePath.match semantics
+    _MCP_CONFIG_RE = compile_union([path_match_regex(pattern) for pattern in MCP_CONFIG_PATTERNS])
+    _MCP_SERVER_RE = compile_union([path_match_regex(pattern) for pattern in MCP_SERVER_PATTERNS])
+    _CONTAINER_RE = compile_union([path_match_regex(pattern) for pattern in CONTAINER_PATTERNS])
+    
+    # Keywords marking MCP-related file names and directories
+    _MCP_FILE_KEYWORD_RE = re.compile(r"mcp|model-context-protocol|claude", re.IGNORECASE)
+    _MCP_DIR_KEYWORD_RE = re.compile(r"mcp|model-context-protocol|claude|anthropic", re.IGNORECASE)
+    
     def __init__(self, config: Config) -> None:
         self.config = config
+        # Sizes of files found by the last discover_files() walk
+        self._file_sizes: Dict[Path, int] = {}
     
     def discover_files(self, root_path: Path) -> List[Path]:
         """Discover all files to be scanned in the given directory tree.
@@ -62,8 +76,10 @@ class FileDiscovery:
         
         discovered_files: List[Path] = []
         processed_paths: Set[Path] = set()
+        self._file_sizes = {}
         
-        for file_path in self._walk_directory(root_path):
+        # Walked files have already passed the config include/exclude patterns
+        for file_path, file_size in self._walk_directory(root_path):
             # Resolve symlinks if following them
             resolved_path = file_path.resolve() if self.config.scan.follow_symlinks else file_path
             
@@ -72,42 +88,132 @@ class FileDiscovery:
                 continue
             processed_paths.add(resolved_path)
             
-            # Check if file should be scanned
-            if self._should_scan_file(file_path):
-                discovered_files.append(file_path)
-                
-                # Check file count limit
-                if (self.config.scan.max_files is not None and 
-                    len(discovered_files) >= self.config.scan.max_files):
-                    break
+            discovered_files.append(file_path)
+            self._file_sizes[file_path] = file_size
+            
+            # Check file count limit
+            if (self.config.scan.max_files is not None and 
+                len(discovered_files) >= self.config.scan.max_files):
+                break
         
         return discovered_files
     
-    def _walk_directory(self, root_path: Path) -> Iterator[Path]:
-        """Walk directory tree yielding files, respecting symlink settings."""
+    def _walk_directory(self, root_path: Path) -> Iterator[Tuple[Path, int]]:
+        """Walk directory tree yielding (path, size) of scannable files within the size limit."""
+        for entry in self._iter_scan_entries(root_path):
+            # Check file is readable and within size limits
+            try:
+                stat = entry.stat()
+                if stat.st_size > self.config.scan.max_file_size:
+                    continue
+            except (OSError, PermissionError):
+                continue
+            
+            yield Path(entry.path), stat.st_size
+    
+    def _iter_scan_entries(self, root: Path) -> Iterator[os.DirEntry]:
+        """Walk a directory tree yielding entries for files that pass the scan patterns.
+        
+        Uses os.scandir and never descends into directories excluded by
+        ``**/NAME/**`` patterns, so trees like node_modules are not enumerated.
+        The entries' file type, and stat result once fetched, are cached.
+        
+        With ``scan.walk_threads`` above 1, a thread pool lists the directories
+        the walk will visit next while earlier entries are being consumed. The
+        entries are yielded in the same order as the single-threaded walk, and
+        at most twice ``walk_threads`` listings run ahead of it, so stopping
+        early (e.g. at ``max_files``) does not pay for listing the whole tree.
+        """
+        if self.config.scan.walk_threads <= 1:
+            yield from self._walk_scan_entries(str(root), None)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=self.config.scan.walk_threads)
         try:
-            for path in root_path.rglob("*"):
-                # Skip directories
-                if path.is_dir():
+            yield from self._walk_scan_entries(str(root), executor)
+        finally:
+            # Listings queued ahead of an abandoned walk are never needed
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _walk_scan_entries(
+        self, root: str, executor: Optional[ThreadPoolExecutor]
+    ) -> Iterator[os.DirEntry]:
+        """Depth-first walk behind _iter_scan_entries, prefetching listings on executor."""
+        follow_symlinks = self.config.scan.follow_symlinks
+        visited_dirs: Set[str] = set()
+        stack = [root]
+        prefetched: Dict[str, Future] = {}
+        max_prefetched = self.config.scan.walk_threads * 2
+        
+        while stack:
+            current_dir = stack.pop()
+            future = prefetched.pop(current_dir, None)
+            if follow_symlinks:
+                # Guard against symlink loops
+                real_dir = os.path.realpath(current_dir)
+                if real_dir in visited_dirs:
                     continue
-                
-                # Handle symlinks
-                if path.is_symlink() and not self.config.scan.follow_symlinks:
+                visited_dirs.add(real_dir)
+            
+            if future is not None:
+                listing = future.result()
+            else:
+                listing = self._list_directory(current_dir)
+            if listing is None:
+                # Skip directories we can't read
+                continue
+            
+            files, subdirs = listing
+            # Visit subdirectories in listing order
+            stack.extend(reversed(subdirs))
+            
+            if executor is not None:
+                # Start listing the directories to be visited next, top of stack first
+                for directory in reversed(stack):
+                    if len(prefetched) >= max_prefetched:
+                        break
+                    if directory not in prefetched:
+                        prefetched[directory] = executor.submit(self._list_directory, directory)
+            
+            yield from files
+    
+    def _list_directory(self, directory: str) -> Optional[Tuple[List[os.DirEntry], List[str]]]:
+        """List one directory as (scannable file entries, subdirectories to visit).
+        
+        Returns None if the directory can't be read.
+        """
+        follow_symlinks = self.config.scan.follow_symlinks
+        # Resolved once per directory rather than once per file
+        filters = self.config.path_filters()
+        excluded_dirs = filters.exclude_dir_names
+        native_separator = os.sep if os.sep != "/" else None
+        
+        try:
+            with os.scandir(directory) as entries:
+                entry_list = list(entries)
+        except OSError:
+            return None
+        
+        files = []
+        subdirs = []
+        for entry in entry_list:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if entry.name not in excluded_dirs:
+                        subdirs.append(entry.path)
                     continue
-                
-                # Check if file is readable and within size limits
-                try:
-                    stat = path.stat()
-                    if stat.st_size > self.config.scan.max_file_size:
-                        continue
-                except (OSError, PermissionError):
+                if not entry.is_file(follow_symlinks=follow_symlinks):
                     continue
-                
-                yield path
-                
-        except (PermissionError, OSError):
-            # Skip directories we can't read
-            pass
+            except OSError:
+                continue
+            
+            path_str = entry.path
+            if native_separator is not None:
+                path_str = path_str.replace(native_separator, "/")
+            if filters.matches(path_str):
+                files.append(entry)
+        
+        return files, subdirs
     
     def _should_scan_file(self, file_path: Path) -> bool:
         """Determine if a file should be scanned based on patterns and rules."""
@@ -127,41 +233,18 @@ class FileDiscovery:
     
     def _is_mcp_related_file(self, file_path: Path) -> bool:
         """Check if file is directly MCP-related."""
-        file_path_str = str(file_path).lower()
-        file_name = file_path.name.lower()
-        
-        # Check for MCP config files
-        for pattern in self.MCP_CONFIG_PATTERNS:
-            if file_path.match(pattern):
-                return True
-        
-        # Check for MCP server files
-        for pattern in self.MCP_SERVER_PATTERNS:
-            if file_path.match(pattern):
-                return True
-        
-        # Check for MCP in filename or path
-        mcp_keywords = ["mcp", "model-context-protocol", "claude"]
-        for keyword in mcp_keywords:
-            if keyword in file_path_str:
-                return True
-        
-        return False
+        path_str = file_path.as_posix()
+        return bool(
+            self._MCP_CONFIG_RE.search(path_str)
+            or self._MCP_SERVER_RE.search(path_str)
+            or self._MCP_FILE_KEYWORD_RE.search(path_str)
+        )
     
     def _is_in_mcp_directory(self, file_path: Path) -> bool:
         """Check if file is in an MCP-related directory."""
-        path_parts = [part.lower() for part in file_path.parts]
-        
-        mcp_dir_keywords = [
-            "mcp", "model-context-protocol", "claude", "claude-desktop",
-            "mcp-server", "mcp_server", "anthropic"
-        ]
-        
-        for keyword in mcp_dir_keywords:
-            if any(keyword in part for part in path_parts):
-                return True
-        
-        return False
+        # Keywords contain no separators, so matching the whole path string
+        # is the same as matching each component
+        return self._MCP_DIR_KEYWORD_RE.search(file_path.as_posix()) is not None
     
     def get_file_category(self, file_path: Path) -> str:
         """Categorize a file based on its type and location.
@@ -169,22 +252,16 @@ class FileDiscovery:
         Returns:
             Category string: 'mcp-config', 'mcp-server', 'container', 'source', 'other'
         """
-        file_path_str = str(file_path)
+        path_str = file_path.as_posix()
         
-        # Check MCP config files
-        for pattern in self.MCP_CONFIG_PATTERNS:
-            if file_path.match(pattern):
-                return "mcp-config"
+        if self._MCP_CONFIG_RE.search(path_str):
+            return "mcp-config"
         
-        # Check MCP server files
-        for pattern in self.MCP_SERVER_PATTERNS:
-            if file_path.match(pattern):
-                return "mcp-server"
+        if self._MCP_SERVER_RE.search(path_str):
+            return "mcp-server"
         
-        # Check container files
-        for pattern in self.CONTAINER_PATTERNS:
-            if file_path.match(pattern):
-                return "container"
+        if self._CONTAINER_RE.search(path_str):
+            return "container"
         
         # Check source code files
         source_extensions = {".py", ".js", ".ts", ".jsx", ".tsx"}
@@ -207,6 +284,12 @@ class FileDiscovery:
             category = self.get_file_category(file_path)
             categories[category] = categories.get(category, 0) + 1
             
+            # Reuse the size from discovery rather than statting again
+            file_size = self._file_sizes.get(file_path)
+            if file_size is not None:
+                total_size += file_size
+                continue
+            
             try:
                 total_size += file_path.stat().st_size
             except (OSError, PermissionError):
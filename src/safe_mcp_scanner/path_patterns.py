@@ -0,0 +1,151 @@
+"""Glob pattern matching on POSIX path strings for file discovery."""
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Pattern, Tuple
+
+# RE2 matches in linear time with a DFA; the path filters fall back to ``re``
+try:
+    import re2
+except ImportError:  # pragma: no cover - google-re2 is an optional speedup
+    re2 = None
+
+
+def glob_segment_to_regex(segment: str) -> str:
+    """Translate a single glob path component into a regex that never crosses '/'."""
+    result = []
+    i, n = 0, len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == "*":
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[":
+            end = segment.find("]", i + 1 if i < n and segment[i] in "!]" else i)
+            if end == -1:
+                result.append(re.escape(char))
+                continue
+            body = segment[i:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            result.append(f"[{body}]")
+            i = end + 1
+        else:
+            result.append(re.escape(char))
+    return "".join(result)
+
+
+def path_match_regex(pattern: str) -> str:
+    """Regex equivalent of ``PurePath.match(pattern)`` on a POSIX path string."""
+    parts = [part for part in pattern.split("/") if part]
+    body = "/".join(glob_segment_to_regex(part) for part in parts)
+    # Relative patterns match from the right, absolute ones must match fully
+    prefix = "^/" if pattern.startswith("/") else "(?:^|/)"
+    return f"{prefix}{body}$"
+
+
+def _include_pattern_regex(pattern: str) -> str:
+    """Translate an include pattern into a regex."""
+    # Patterns like **/*.py match on the trailing components
+    return path_match_regex(pattern.replace("**/", "") if "**" in pattern else pattern)
+
+
+def compile_union(regexes: List[str]) -> Optional[Pattern[str]]:
+    """Compile regex alternatives into a single pattern (None if there are none).
+    
+    Uses RE2 when installed so each path is matched in one DFA pass regardless
+    of the number of patterns.
+    """
+    regexes = [regex for regex in regexes if regex]
+    if not regexes:
+        return None
+    
+    union = "|".join(f"(?:{regex})" for regex in regexes)
+    if re2 is not None:
+        try:
+            return re2.compile(union)
+        except Exception:
+            pass  # Not expressible in RE2; use the backtracking engine
+    return re.compile(union)
+
+
+@dataclass(frozen=True)
+class PathFilters:
+    """Include/exclude patterns compiled for fast per-file matching."""
+    
+    include_re: Optional[Pattern[str]]
+    exclude_re: Optional[Pattern[str]]
+    exclude_dir_names: FrozenSet[str]
+    exclude_suffixes: Tuple[str, ...]
+    
+    def matches(self, path_str: str) -> bool:
+        """Check a POSIX path string against the include/exclude patterns."""
+        # Check exclude patterns first: directory names and extensions need
+        # no regex, the remaining patterns share one compiled alternation
+        if self.exclude_dir_names and not self.exclude_dir_names.isdisjoint(
+            path_str.split("/")
+        ):
+            return False
+        if self.exclude_suffixes and path_str.endswith(self.exclude_suffixes):
+            return False
+        if self.exclude_re is not None and self.exclude_re.search(path_str):
+            return False
+        
+        # Check include patterns
+        return self.include_re is not None and self.include_re.search(path_str) is not None
+
+
+def _is_literal(text: str) -> bool:
+    """Check whether a glob fragment contains no wildcards."""
+    return not any(char in text for char in "*?[")
+
+
+@functools.lru_cache(maxsize=32)
+def compile_path_filters(
+    include_patterns: Tuple[str, ...], exclude_patterns: Tuple[str, ...]
+) -> PathFilters:
+    """Compile include/exclude glob lists for matching against POSIX path strings.
+    
+    Keyed on the pattern tuples, so CLI overrides that replace or mutate the
+    pattern lists pick up freshly compiled filters automatically.
+    """
+    exclude_dir_names = set()
+    exclude_suffixes = []
+    exclude_regexes = []
+    
+    for pattern in exclude_patterns:
+        if "**" in pattern:
+            if "/**" in pattern:
+                # Patterns like **/node_modules/** exclude any path containing the directory
+                for name in pattern.split("/"):
+                    if not name or name == "**":
+                        continue
+                    if _is_literal(name):
+                        exclude_dir_names.add(name)
+                    else:
+                        exclude_regexes.append(
+                            f"(?:^|/){glob_segment_to_regex(name)}(?:/|$)"
+                        )
+                continue
+            
+            # Patterns like **/*.pyc match against the file name
+            name_pattern = pattern.replace("**/", "")
+            suffix = name_pattern[1:]
+            if name_pattern.startswith("*") and _is_literal(suffix) and "/" not in suffix:
+                exclude_suffixes.append(suffix)
+            else:
+                exclude_regexes.append(path_match_regex(name_pattern))
+        else:
+            exclude_regexes.append(path_match_regex(pattern))
+    
+    return PathFilters(
+        include_re=compile_union([_include_pattern_regex(p) for p in include_patterns]),
+        exclude_re=compile_union(exclude_regexes),
+        exclude_dir_names=frozenset(exclude_dir_names),
+        exclude_suffixes=tuple(exclude_suffixes),
+    )
@@ -1,13 +1,26 @@
 """Base class for result reporters."""
 
+import operator
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, BinaryIO, NamedTuple, Optional, Tuple
 
 from ..techniques.base import Finding
 
 
+# Severity ranks; unknown severities rank as low
+SEVERITY_LEVELS = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+
+class _FindingIndex(NamedTuple):
+    """Findings grouped in a single pass, with the findings it was built from."""
+    
+    snapshot: Tuple[Finding, ...]
+    by_severity: Dict[str, List[Finding]]
+    by_technique: Dict[str, List[Finding]]
+
+
 @dataclass
 class ScanResults:
     """Container for scan results."""
@@ -18,40 +31,57 @@ class ScanResults:
     scan_duration: float
     scanner_version: str = "0.1.0"
     
-    def has_findings_at_severity(self, severity: str) -> bool:
-        """Check if there are findings at or above the specified severity."""
-        severity_levels = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-        min_level = severity_levels.get(severity.lower(), 0)
+    # Reused while findings holds the same Finding objects in the same order
+    _index: Optional[_FindingIndex] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _get_index(self) -> _FindingIndex:
+        """Get findings grouped by severity and technique.
         
-        for finding in self.findings:
-            finding_level = severity_levels.get(finding.severity.lower(), 0)
-            if finding_level >= min_level:
-                return True
+        The index is shared between calls and must not be modified; it is
+        rebuilt whenever findings are added, removed, replaced or reordered.
+        """
+        index = self._index
+        if (index is not None and len(index.snapshot) == len(self.findings)
+                and all(map(operator.is_, index.snapshot, self.findings))):
+            return index
         
-        return False
-    
-    def get_findings_by_severity(self) -> Dict[str, List[Finding]]:
-        """Group findings by severity level."""
-        grouped = {"low": [], "medium": [], "high": [], "critical": []}
+        by_severity: Dict[str, List[Finding]] = {"low": [], "medium": [], "high": [], "critical": []}
+        by_technique: Dict[str, List[Finding]] = {}
         
         for finding in self.findings:
             severity = finding.severity.lower()
-            if severity in grouped:
-                grouped[severity].append(finding)
+            if severity in by_severity:
+                by_severity[severity].append(finding)
+            
+            technique_findings = by_technique.get(finding.technique_id)
+            if technique_findings is None:
+                technique_findings = by_technique[finding.technique_id] = []
+            technique_findings.append(finding)
         
-        return grouped
+        self._index = _FindingIndex(tuple(self.findings), by_severity, by_technique)
+        return self._index
+    
+    def has_findings_at_severity(self, severity: str) -> bool:
+        """Check if there are findings at or above the specified severity."""
+        min_level = SEVERITY_LEVELS.get(severity.lower(), 0)
+        return any(
+            SEVERITY_LEVELS.get(finding.severity.lower(), 0) >= min_level
+            for finding in self.findings
+        )
+    
+    def get_findings_by_severity(self) -> Dict[str, List[Finding]]:
+        """Group findings by severity level."""
+        return {
+            severity: list(findings)
+            for severity, findings in self._get_index().by_severity.items()
+        }
     
     def get_findings_by_technique(self) -> Dict[str, List[Finding]]:
         """Group findings by technique ID."""
-        grouped = {}
-        
-        for finding in self.findings:
-            technique_id = finding.technique_id
-            if technique_id not in grouped:
-                grouped[technique_id] = []
-            grouped[technique_id].append(finding)
-        
-        return grouped
+        return {
+            technique_id: list(findings)
+            for technique_id, findings in self._get_index().by_technique.items()
+        }
 
 
 class BaseReporter(ABC):
@@ -81,6 +111,32 @@ class BaseReporter(ABC):
         """
         pass
     
+    def format_results_bytes(self, results: ScanResults) -> bytes:
+        """Format scan results as UTF-8 encoded bytes.
+        
+        Reporters that serialize straight to bytes can override this to skip
+        the intermediate string when writing to files.
+        
+        Args:
+            results: Scan results to format
+            
+        Returns:
+            Formatted output as bytes
+        """
+        return self.format_results(results).encode("utf-8")
+    
+    def write_results(self, results: ScanResults, stream: BinaryIO) -> None:
+        """Write formatted scan results to a binary stream.
+        
+        Reporters that can serialize incrementally should override this so
+        the full report is never held in memory.
+        
+        Args:
+            results: Scan results to format
+            stream: Binary stream to write UTF-8 output to
+        """
+        stream.write(self.format_results_bytes(results))
+    
     def should_include_source(self, finding: Finding) -> bool:
         """Determine if source code should be included for a finding."""
         return finding.source_code is not None and len(finding.source_code.strip()) > 0
\ No newline at end of file
@@ -1,9 +1,10 @@
 """JSON output reporter for scan results."""
 
-import json
+import io
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Optional
 
+from ..serialization import write_json
 from .base import BaseReporter, ScanResults
 
 
@@ -27,7 +28,37 @@ class JSONReporter(BaseReporter):
         Returns:
             JSON formatted string
         """
-        # Build the main result structure
+        return self.format_results_bytes(results).decode("utf-8")
+    
+    def format_results_bytes(self, results: ScanResults) -> bytes:
+        """Format scan results as UTF-8 encoded JSON.
+        
+        Args:
+            results: Scan results to format
+            
+        Returns:
+            JSON formatted bytes
+        """
+        buffer = io.BytesIO()
+        self.write_results(results, buffer)
+        return buffer.getvalue()
+    
+    def write_results(self, results: ScanResults, stream: BinaryIO) -> None:
+        """Write scan results as UTF-8 encoded JSON, one finding at a time.
+        
+        Args:
+            results: Scan results to format
+            stream: Binary stream to write to
+        """
+        # Format each distinct path once; findings mostly point at files
+        # that are also in the scanned list
+        path_strs = {path: str(path) for path in results.scanned_files}
+        for finding in results.findings:
+            if finding.file_path not in path_strs:
+                path_strs[finding.file_path] = str(finding.file_path)
+        
+        # Build the main result structure; findings and file lists are
+        # generators so each entry is formatted only as it is written
         json_data = {
             "scan_info": {
                 "scanner_name": "SAFE-MCP Scanner",
@@ -38,16 +69,21 @@ class JSONReporter(BaseReporter):
                 "total_files_discovered": results.total_files
             },
             "summary": self._create_summary(results),
-            "findings": [self._format_finding(finding) for finding in results.findings],
-            "files_scanned": [str(path) for path in results.scanned_files]
+            "findings": (
+                self._format_finding(finding, path_strs[finding.file_path])
+                for finding in results.findings
+            ),
+            "files_scanned": (path_strs[path] for path in results.scanned_files)
         }
         
-        return json.dumps(json_data, indent=2, ensure_ascii=False)
+        write_json(stream, json_data)
     
     def _create_summary(self, results: ScanResults) -> Dict[str, Any]:
         """Create summary section of the report."""
-        findings_by_severity = results.get_findings_by_severity()
-        findings_by_technique = results.get_findings_by_technique()
+        # Both groupings come from one pass over the findings; they are only read
+        index = results._get_index()
+        findings_by_severity = index.by_severity
+        findings_by_technique = index.by_technique
         
         return {
             "total_findings": len(results.findings),
@@ -64,11 +100,11 @@ class JSONReporter(BaseReporter):
             "files_with_findings": len(set(finding.file_path for finding in results.findings))
         }
     
-    def _format_finding(self, finding) -> Dict[str, Any]:
+    def _format_finding(self, finding, file_path_str: Optional[str] = None) -> Dict[str, Any]:
         """Format a single finding for JSON output."""
         finding_data = {
             "technique_id": finding.technique_id,
-            "file_path": str(finding.file_path),
+            "file_path": file_path_str if file_path_str is not None else str(finding.file_path),
             "severity": finding.severity,
             "confidence": finding.confidence,
             "message": finding.message,
@@ -1,18 +1,39 @@
 """Main scanning orchestrator for the SAFE-MCP Scanner."""
 
+import logging
+import os
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .config import Config
+from .techniques import TECHNIQUE_REGISTRY
 from .techniques.base import BaseTechnique, Finding
-from .detectors.base import BaseDetector
+from .detectors.base import BaseDetector, read_file_bytes
 from .reporters.base import BaseReporter, ScanResults
 from .file_discovery import FileDiscovery
 from .technique_loader import TechniqueLoader
 from .reporter_factory import ReporterFactory
 
 
+logger = logging.getLogger(__name__)
+
+# Number of files scanned between progress callbacks
+PROGRESS_BATCH_SIZE = 50
+
+# Number of files sent to a worker process per task
+WORKER_BATCH_SIZE = 64
+
+# Scans of fewer files than this stay in-process, where starting a worker
+# pool would cost more than it saves
+PARALLEL_MIN_FILES = 256
+
+# Write buffer for report files; reports are streamed in many small writes
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
 class Scanner:
     """Main scanner class that orchestrates the scanning process."""
     
@@ -25,6 +46,11 @@ class Scanner:
         # Load available techniques
         self._techniques: Dict[str, BaseTechnique] = {}
         self._load_techniques()
+        
+        # Applicable techniques per file suffix, for the techniques dict last
+        # passed to _scan_file
+        self._indexed_techniques: Optional[Dict[str, BaseTechnique]] = None
+        self._techniques_by_suffix: Dict[str, List[Tuple[str, BaseTechnique, bool, float]]] = {}
     
     def _load_techniques(self) -> None:
         """Load and initialize available techniques."""
@@ -42,11 +68,18 @@ class Scanner:
             if technique.is_enabled()
         }
     
-    def scan(self, target_path: Path) -> ScanResults:
+    def scan(
+        self,
+        target_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> ScanResults:
         """Perform a security scan on the target path.
         
         Args:
             target_path: Directory or file to scan
+            progress_callback: Optional callable receiving (files scanned,
+                files to scan); called once discovery finishes, then every
+                PROGRESS_BATCH_SIZE files and on completion
             
         Returns:
             Scan results containing findings and metadata
@@ -67,13 +100,35 @@ class Scanner:
         # Scan files
         all_findings: List[Finding] = []
         scanned_files: List[Path] = []
+        files_to_report = len(files_to_scan)
+        
+        if progress_callback is not None:
+            progress_callback(0, files_to_report)
+        
+        workers = self._get_worker_count(files_to_report)
+        if workers > 1 and self._workers_can_load(enabled_techniques):
+            findings_per_file = self._scan_files_parallel(
+                files_to_scan, workers, list(enabled_techniques)
+            )
+        else:
+            findings_per_file = (
+                self._scan_file(file_path, enabled_techniques)
+                for file_path in files_to_scan
+            )
         
-        for file_path in files_to_scan:
-            file_findings = self._scan_file(file_path, enabled_techniques)
+        for index, (file_path, file_findings) in enumerate(
+            zip(files_to_scan, findings_per_file), 1
+        ):
             all_findings.extend(file_findings)
             
             if file_findings or self._should_track_file(file_path):
                 scanned_files.append(file_path)
+            
+            if progress_callback is not None and index % PROGRESS_BATCH_SIZE == 0:
+                progress_callback(index, files_to_report)
+        
+        if progress_callback is not None:
+            progress_callback(files_to_report, files_to_report)
         
         # Calculate scan duration
         scan_duration = time.time() - start_time
@@ -89,27 +144,111 @@ class Scanner:
         """Scan a single file with applicable techniques."""
         findings: List[Finding] = []
         
-        for technique_id, technique in techniques.items():
+        applicable = self._get_file_techniques(file_path, techniques)
+        if not applicable:
+            return findings
+        
+        # Read once and share the bytes between techniques
+        try:
+            data = read_file_bytes(file_path, self.config.scan.max_file_size)
+        except ValueError:
+            # File too large or unreadable
+            return findings
+        
+        for technique_id, technique, check_file, threshold in applicable:
             try:
-                if technique.can_analyze_file(file_path):
-                    technique_findings = technique.analyze_file(file_path)
+                if not check_file or technique.can_analyze_file(file_path):
+                    technique_findings = technique.analyze_bytes(file_path, data)
                     
                     # Filter findings by confidence threshold
-                    technique_config = technique.get_technique_config()
-                    filtered_findings = [
-                        finding for finding in technique_findings
-                        if finding.confidence >= technique_config.confidence_threshold
-                    ]
-                    
-                    findings.extend(filtered_findings)
+                    if threshold <= 0:
+                        findings.extend(technique_findings)
+                    else:
+                        findings.extend(
+                            finding for finding in technique_findings
+                            if finding.confidence >= threshold
+                        )
                     
             except Exception as e:
                 # Log error but continue scanning
-                # In a real implementation, this would use proper logging
-                print(f"Warning: Error scanning {file_path} with {technique_id}: {e}")
+                logger.warning("Error scanning %s with %s: %s", file_path, technique_id, e)
         
         return findings
     
+    def _get_file_techniques(
+        self, file_path: Path, techniques: Dict[str, BaseTechnique]
+    ) -> List[Tuple[str, BaseTechnique, bool, float]]:
+        """Get techniques that may analyze a file.
+        
+        Returns (technique_id, technique, check_file, confidence_threshold)
+        entries. Decisions for techniques using the default suffix-based
+        can_analyze_file are made once per suffix. Techniques that override it
+        are included with check_file set, to be asked about each file.
+        """
+        if techniques is not self._indexed_techniques:
+            self._indexed_techniques = techniques
+            self._techniques_by_suffix = {}
+        
+        file_ext = file_path.suffix.lower()
+        applicable = self._techniques_by_suffix.get(file_ext)
+        if applicable is None:
+            applicable = []
+            for technique_id, technique in techniques.items():
+                threshold = technique.get_technique_config().confidence_threshold
+                if type(technique).can_analyze_file is not BaseTechnique.can_analyze_file:
+                    applicable.append((technique_id, technique, True, threshold))
+                else:
+                    try:
+                        if technique.handles_suffix(file_ext):
+                            applicable.append((technique_id, technique, False, threshold))
+                    except Exception:
+                        # Let _scan_file report the error for each file
+                        applicable.append((technique_id, technique, True, threshold))
+            self._techniques_by_suffix[file_ext] = applicable
+        
+        return applicable
+    
+    def _get_worker_count(self, file_count: int) -> int:
+        """Get the number of worker processes to scan file_count files with."""
+        if file_count < PARALLEL_MIN_FILES:
+            return 1
+        
+        workers = self.config.scan.workers or os.cpu_count() or 1
+        batches = -(-file_count // WORKER_BATCH_SIZE)
+        return min(workers, batches)
+    
+    def _workers_can_load(self, techniques: Dict[str, BaseTechnique]) -> bool:
+        """Check that worker processes would load the same techniques themselves.
+        
+        Workers only see registered techniques; one added to this scanner
+        directly can't be rebuilt there, so such scans stay in-process.
+        """
+        return all(
+            TECHNIQUE_REGISTRY.get(technique_id) is type(technique)
+            for technique_id, technique in techniques.items()
+        )
+    
+    def _scan_files_parallel(
+        self, files: List[Path], workers: int, technique_ids: List[str]
+    ) -> Iterator[List[Finding]]:
+        """Scan files in worker processes, yielding findings in file order.
+        
+        Each worker loads its own techniques from this scanner's config, so
+        compiled patterns are built once per process rather than pickled,
+        and scans with those among technique_ids, the ones enabled here.
+        """
+        batches = [
+            files[start:start + WORKER_BATCH_SIZE]
+            for start in range(0, len(files), WORKER_BATCH_SIZE)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.config, tuple(technique_ids))
+        ) as executor:
+            for batch_findings in executor.map(_scan_batch, batches):
+                yield from batch_findings
+    
     def _should_track_file(self, file_path: Path) -> bool:
         """Determine if a file should be tracked even without findings."""
         # Track all files that were actually processed
@@ -128,6 +267,30 @@ class Scanner:
         reporter = self.reporter_factory.get_reporter(output_format)
         return reporter.format_results(results)
     
+    def format_results_bytes(self, results: ScanResults, output_format: str) -> bytes:
+        """Format scan results as UTF-8 encoded bytes for writing to files.
+        
+        Args:
+            results: Scan results to format
+            output_format: Target format (json, sarif, text, html)
+            
+        Returns:
+            Formatted output bytes
+        """
+        reporter = self.reporter_factory.get_reporter(output_format)
+        return reporter.format_results_bytes(results)
+    
+    def write_results(self, results: ScanResults, output_format: str, stream: BinaryIO) -> None:
+        """Write scan results in the specified format to a binary stream.
+        
+        Args:
+            results: Scan results to format
+            output_format: Target format (json, sarif, text, html)
+            stream: Binary stream to write UTF-8 output to
+        """
+        reporter = self.reporter_factory.get_reporter(output_format)
+        reporter.write_results(results, stream)
+    
     def scan_and_report(
         self, 
         target_path: Path, 
@@ -145,11 +308,43 @@ class Scanner:
             Scan results
         """
         results = self.scan(target_path)
-        formatted_output = self.format_results(results, output_format)
         
         if output_file:
-            output_file.write_text(formatted_output)
+            with output_file.open("wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+                self.write_results(results, output_format, stream)
         else:
-            print(formatted_output)
+            # Write encoded output straight to stdout's binary buffer when
+            # there is one, rather than through print and the text layer
+            stdout_buffer = getattr(sys.stdout, "buffer", None)
+            if stdout_buffer is not None:
+                sys.stdout.flush()
+                self.write_results(results, output_format, stdout_buffer)
+                stdout_buffer.write(b"\n")
+                stdout_buffer.flush()
+            else:
+                print(self.format_results(results, output_format))
         
-        return results
\ No newline at end of file
+        return results
+
+
+# Scanner owned by the current worker process and its enabled techniques,
+# set up by _init_worker
+_worker_scanner: Optional[Scanner] = None
+_worker_techniques: Dict[str, BaseTechnique] = {}
+
+
+def _init_worker(config: Config, technique_ids: Tuple[str, ...]) -> None:
+    """Create the scanner used by this worker process and select its techniques."""
+    global _worker_scanner, _worker_techniques
+    _worker_scanner = Scanner(config)
+    available = _worker_scanner.get_available_techniques()
+    _worker_techniques = {
+        technique_id: available[technique_id]
+        for technique_id in technique_ids
+        if technique_id in available
+    }
+
+
+def _scan_batch(files: List[Path]) -> List[List[Finding]]:
+    """Scan a batch of files in a worker process."""
+    return [_worker_scanner._scan_file(file_path, _worker_techniques) for file_path in files]
@@ -0,0 +1,77 @@
+"""JSON serialization helpers with optional orjson/msgspec fast paths."""
+
+import json
+from typing import Any, BinaryIO, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional speedup
+    msgspec = None  # type: ignore[assignment]
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON.
+    
+    Uses orjson when it is installed (several times faster for large
+    reports) and falls back to the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(stream: BinaryIO, data: Any, level: int = 0) -> None:
+    """Write data to a binary stream as indented UTF-8 JSON.
+    
+    Produces the same output as dumps_json, except that iterators are
+    written as arrays one element at a time, as are dicts containing them,
+    so large reports never exist as a single document in memory.
+    
+    Args:
+        stream: Binary stream to write to
+        data: Data to serialize
+        level: Indentation level data starts at
+    """
+    inner_indent = b"\n" + b"  " * (level + 1)
+    
+    if isinstance(data, dict) and any(isinstance(value, Iterator) for value in data.values()):
+        for index, (key, value) in enumerate(data.items()):
+            stream.write((b"," if index else b"{") + inner_indent + dumps_json(key) + b": ")
+            write_json(stream, value, level + 1)
+        stream.write(b"\n" + b"  " * level + b"}")
+    elif isinstance(data, Iterator):
+        empty = True
+        for item in data:
+            stream.write((b"[" if empty else b",") + inner_indent)
+            write_json(stream, item, level + 1)
+            empty = False
+        stream.write(b"[]" if empty else b"\n" + b"  " * level + b"]")
+    else:
+        encoded = dumps_json(data)
+        if level:
+            # JSON strings never contain raw newlines, so this only re-indents
+            encoded = encoded.replace(b"\n", b"\n" + b"  " * level)
+        stream.write(encoded)
+
+
+def dumps_compact_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON for machine-read caches."""
+    if msgspec is not None:
+        return msgspec.json.encode(data)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize UTF-8 JSON produced by the dump helpers."""
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,13 +2,18 @@
 
 import importlib
 import importlib.util
-import pkgutil
+import logging
+import sys
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Type, List
 
 from .config import Config
 from .techniques.base import BaseTechnique
-from .techniques import TECHNIQUE_REGISTRY
+from .techniques import BUILTIN_TECHNIQUE_MODULES, TECHNIQUE_REGISTRY
+
+
+logger = logging.getLogger(__name__)
 
 
 class TechniqueLoader:
@@ -35,20 +40,14 @@ class TechniqueLoader:
     
     def _load_builtin_techniques(self) -> None:
         """Load built-in SAFE-MCP techniques."""
-        # Import all modules in the techniques package to trigger registration
-        import safe_mcp_scanner.techniques
-        
-        techniques_package = safe_mcp_scanner.techniques
-        techniques_path = Path(techniques_package.__file__).parent
-        
-        # Walk through all Python modules in the techniques directory
-        for module_info in pkgutil.walk_packages([str(techniques_path)], 
-                                                prefix="safe_mcp_scanner.techniques."):
+        # Import the built-in technique modules to trigger registration
+        for module_name in BUILTIN_TECHNIQUE_MODULES:
+            module_path = f"safe_mcp_scanner.techniques.{module_name}"
             try:
-                importlib.import_module(module_info.name)
+                importlib.import_module(module_path)
             except ImportError as e:
                 # Log warning but continue loading other techniques
-                print(f"Warning: Could not load technique module {module_info.name}: {e}")
+                logger.warning("Could not load technique module %s: %s", module_path, e)
         
         # Instantiate registered techniques
         for technique_id, technique_class in TECHNIQUE_REGISTRY.items():
@@ -56,7 +55,7 @@ class TechniqueLoader:
                 technique_instance = technique_class(self.config)
                 self._loaded_techniques[technique_id] = technique_instance
             except Exception as e:
-                print(f"Warning: Could not instantiate technique {technique_id}: {e}")
+                logger.warning("Could not instantiate technique %s: %s", technique_id, e)
     
     def _load_custom_techniques(self, plugin_dir: Path) -> None:
         """Load custom techniques from a plugin directory.
@@ -67,34 +66,41 @@ class TechniqueLoader:
         if not plugin_dir.exists() or not plugin_dir.is_dir():
             return
         
+        # Skip private modules
+        python_files = [
+            python_file for python_file in sorted(plugin_dir.glob("*.py"))
+            if not python_file.name.startswith("_")
+        ]
+        if not python_files:
+            return
+        
         # Add plugin directory to Python path temporarily
-        import sys
         original_path = sys.path.copy()
         
         try:
             sys.path.insert(0, str(plugin_dir))
             
-            # Look for Python files in the plugin directory
-            for python_file in plugin_dir.glob("*.py"):
-                if python_file.name.startswith("_"):
-                    continue  # Skip private modules
-                
+            for python_file in python_files:
                 module_name = python_file.stem
                 try:
                     # Import the custom module
                     spec = importlib.util.spec_from_file_location(module_name, python_file)
                     if spec and spec.loader:
+                        registered_count = len(TECHNIQUE_REGISTRY)
                         module = importlib.util.module_from_spec(spec)
                         spec.loader.exec_module(module)
                         
-                        # Check if any new techniques were registered
-                        for technique_id, technique_class in TECHNIQUE_REGISTRY.items():
+                        # New registrations are appended to the registry, so
+                        # only entries past the previous size are checked
+                        for technique_id, technique_class in islice(
+                            TECHNIQUE_REGISTRY.items(), registered_count, None
+                        ):
                             if technique_id not in self._loaded_techniques:
                                 technique_instance = technique_class(self.config)
                                 self._loaded_techniques[technique_id] = technique_instance
                 
                 except Exception as e:
-                    print(f"Warning: Could not load custom technique from {python_file}: {e}")
+                    logger.warning("Could not load custom technique from %s: %s", python_file, e)
         
         finally:
             # Restore original Python path
@@ -1,9 +1,16 @@
 """SAFE-MCP technique implementations."""
 
-from typing import Dict, List
+from typing import Dict, List, Type
 from .base import BaseTechnique
 
 __all__ = ["BaseTechnique"]
 
 # Registry for technique discovery
-TECHNIQUE_REGISTRY: Dict[str, BaseTechnique] = {}
\ No newline at end of file
+TECHNIQUE_REGISTRY: Dict[str, Type[BaseTechnique]] = {}
+
+# Built-in technique modules, imported by the loader to populate the registry.
+# Listed statically so startup doesn't have to walk the package directory.
+BUILTIN_TECHNIQUE_MODULES: List[str] = [
+    "command_injection",
+    "malicious_tools",
+]
\ No newline at end of file
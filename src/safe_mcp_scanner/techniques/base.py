@@ -1,14 +1,19 @@
 """Base class for SAFE-MCP technique implementations."""
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from ..config import Config
 
 
-@dataclass
+# Slots drop the per-instance __dict__; dataclass supports them from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Finding:
     """Represents a security finding from a technique."""
     
@@ -22,11 +27,7 @@ class Finding:
     description: str = ""
     recommendation: str = ""
     source_code: Optional[str] = None
-    metadata: Dict[str, Any] = None
-    
-    def __post_init__(self) -> None:
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class BaseTechnique(ABC):
@@ -95,13 +96,33 @@ class BaseTechnique(ABC):
         """
         pass
     
+    def analyze_bytes(self, file_path: Path, data: bytes) -> List[Finding]:
+        """Analyze a file whose contents have already been read.
+        
+        The scanner reads each file once and passes the bytes to every
+        applicable technique. Techniques that can work from the bytes should
+        override this; the default reads the file again via analyze_file().
+        
+        Args:
+            file_path: Path to the file being analyzed
+            data: File contents
+            
+        Returns:
+            List of security findings
+        """
+        return self.analyze_file(file_path)
+    
     def can_analyze_file(self, file_path: Path) -> bool:
         """Check if this technique can analyze the given file."""
-        if "*" in self.file_types:
+        return self.handles_suffix(file_path.suffix.lower())
+    
+    def handles_suffix(self, file_ext: str) -> bool:
+        """Check if file_types covers files with the given lowercase suffix."""
+        file_types = self.file_types
+        if "*" in file_types:
             return True
         
-        file_ext = file_path.suffix.lower()
-        return file_ext in self.file_types or f"*{file_ext}" in self.file_types
+        return file_ext in file_types or f"*{file_ext}" in file_types
     
     def create_finding(
         self,
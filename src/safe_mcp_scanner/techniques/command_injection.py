@@ -1,7 +1,7 @@
 """SAFE-T1101: Command Injection technique implementation."""
 
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from .base import BaseTechnique, Finding, register_technique
 from ..detectors.pattern_matcher import PatternMatcher
@@ -14,6 +14,10 @@ class CommandInjectionTechnique(BaseTechnique):
     def __init__(self, config) -> None:
         super().__init__(config)
         self.pattern_matcher = PatternMatcher(config)
+        # Built once; the compiled regexes are cached by the pattern matcher
+        self._patterns = self.pattern_matcher.create_command_injection_patterns()
+        # MCP-specific recommendation for each pattern recommendation
+        self._mcp_recommendations: Dict[str, str] = {}
     
     @property
     def technique_id(self) -> str:
@@ -44,29 +48,41 @@ class CommandInjectionTechnique(BaseTechnique):
         return [".py", ".js", ".ts"]
     
     def analyze_file(self, file_path: Path) -> List[Finding]:
-        """Analyze a file for command injection vulnerabilities."""
+        """Analyze a file for command injection."""
         if not self.pattern_matcher.can_analyze_file(file_path):
             return []
         
-        # Get patterns for command injection detection
-        patterns = self.pattern_matcher.create_command_injection_patterns()
-        
         # Run pattern matching
-        findings = self.pattern_matcher.analyze_file(file_path, patterns)
+        findings = self.pattern_matcher.analyze_file(file_path, self._patterns)
+        
+        return self._enhance_findings(findings)
+    
+    def analyze_bytes(self, file_path: Path, data: bytes) -> List[Finding]:
+        """Analyze already-read file contents for command injection."""
+        if not self.pattern_matcher.can_analyze_bytes(file_path, data):
+            return []
         
-        # Enhance findings with technique-specific information
-        enhanced_findings = []
+        findings = self.pattern_matcher.analyze_bytes(file_path, data, self._patterns)
+        
+        return self._enhance_findings(findings)
+    
+    def _enhance_findings(self, findings: List[Finding]) -> List[Finding]:
+        """Add technique-specific information to pattern findings, in place."""
+        technique_id = self.technique_id
+        mcp_recommendations = self._mcp_recommendations
         for finding in findings:
             # Override technique ID to ensure consistency
-            finding.technique_id = self.technique_id
+            finding.technique_id = technique_id
             
             # Add MCP-specific context to recommendations
+            # Built once per pattern recommendation and shared between findings
             if "MCP" not in finding.recommendation:
-                finding.recommendation = (
-                    f"In MCP servers: {finding.recommendation}. "
-                    "Ensure all tool parameters are properly validated before use in system commands."
-                )
-            
-            enhanced_findings.append(finding)
+                recommendation = mcp_recommendations.get(finding.recommendation)
+                if recommendation is None:
+                    recommendation = mcp_recommendations[finding.recommendation] = (
+                        f"In MCP servers: {finding.recommendation}. "
+                        "Ensure all tool parameters are properly validated before use in system commands."
+                    )
+                finding.recommendation = recommendation
         
-        return enhanced_findings
\ No newline at end of file
+        return findings
@@ -11,9 +11,18 @@ from ..detectors.pattern_matcher import PatternMatcher
 class MaliciousToolTechnique(BaseTechnique):
     """Detects potentially malicious MCP tool descriptions and configurations."""
     
+    # Recommendation given for every finding
+    _MCP_RECOMMENDATION = (
+        "Review MCP tool description for social engineering indicators. "
+        "Ensure tool descriptions accurately reflect their functionality and "
+        "do not attempt to mislead users into providing sensitive information."
+    )
+    
     def __init__(self, config) -> None:
         super().__init__(config)
         self.pattern_matcher = PatternMatcher(config)
+        # Built once; the compiled regexes are cached by the pattern matcher
+        self._patterns = self.pattern_matcher.create_malicious_tool_patterns()
     
     @property
     def technique_id(self) -> str:
@@ -48,25 +57,28 @@ class MaliciousToolTechnique(BaseTechnique):
         if not self.pattern_matcher.can_analyze_file(file_path):
             return []
         
-        # Get patterns for malicious tool detection
-        patterns = self.pattern_matcher.create_malicious_tool_patterns()
-        
         # Run pattern matching
-        findings = self.pattern_matcher.analyze_file(file_path, patterns)
+        findings = self.pattern_matcher.analyze_file(file_path, self._patterns)
+        
+        return self._enhance_findings(findings)
+    
+    def analyze_bytes(self, file_path: Path, data: bytes) -> List[Finding]:
+        """Analyze already-read file contents for malicious tool descriptions."""
+        if not self.pattern_matcher.can_analyze_bytes(file_path, data):
+            return []
+        
+        findings = self.pattern_matcher.analyze_bytes(file_path, data, self._patterns)
         
-        # Enhance findings with technique-specific information
-        enhanced_findings = []
+        return self._enhance_findings(findings)
+    
+    def _enhance_findings(self, findings: List[Finding]) -> List[Finding]:
+        """Add technique-specific information to pattern findings, in place."""
+        technique_id = self.technique_id
         for finding in findings:
             # Override technique ID to ensure consistency
-            finding.technique_id = self.technique_id
+            finding.technique_id = technique_id
             
             # Add MCP-specific context
-            finding.recommendation = (
-                "Review MCP tool description for social engineering indicators. "
-                "Ensure tool descriptions accurately reflect their functionality and "
-                "do not attempt to mislead users into providing sensitive information."
-            )
-            
-            enhanced_findings.append(finding)
+            finding.recommendation = self._MCP_RECOMMENDATION
         
-        return enhanced_findings
\ No newline at end of file
+        return findings
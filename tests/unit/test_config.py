@@ -1,10 +1,13 @@
 """Unit tests for configuration management."""
 
+import json
 from pathlib import Path
 import pytest
 import tempfile
 
-from safe_mcp_scanner.config import Config, load_config, merge_configs
+from safe_mcp_scanner.config import (
+    Config, TechniqueConfig, find_config_files, load_config, merge_configs
+)
 
 
 class TestConfig:
@@ -49,6 +52,18 @@ class TestConfig:
         # Should skip node_modules
         assert config.should_scan_file(Path("node_modules/package/index.js")) is False
     
+    def test_file_filtering_after_pattern_override(self):
+        """Test compiled filters follow changes to the pattern lists."""
+        config = Config()
+        assert config.should_scan_file(Path("docs/readme.md")) is False
+        
+        config.scan.include_patterns = ["**/*.md"]
+        config.scan.exclude_patterns.append("**/build/**")
+        
+        assert config.should_scan_file(Path("docs/readme.md")) is True
+        assert config.should_scan_file(Path("build/readme.md")) is False
+        assert config.should_scan_file(Path("src/module.py")) is False
+    
     def test_invalid_technique_id_validation(self):
         """Test validation of technique ID format."""
         with pytest.raises(ValueError, match="Invalid technique ID format"):
@@ -58,6 +73,33 @@ class TestConfig:
         """Test severity level validation."""
         with pytest.raises(ValueError):
             Config(fail_on_severity="invalid")
+    
+    def test_technique_config_validation(self):
+        """Test technique settings are validated and defaults are shared."""
+        config = Config(techniques={"SAFE-T1001": {"severity": "high"}})
+        assert config.get_technique_config("SAFE-T1001").severity == "high"
+        assert config.get_technique_config("SAFE-T1101") is config.get_technique_config("SAFE-T1999")
+        
+        with pytest.raises(ValueError):
+            Config(techniques={"SAFE-T1001": {"confidence_threshold": 1.5}})
+    
+    def test_technique_config_direct_construction(self):
+        """Test technique settings are validated and immutable when built directly."""
+        with pytest.raises(ValueError, match="confidence_threshold"):
+            TechniqueConfig(confidence_threshold=1.5)
+        with pytest.raises(ValueError, match="severity"):
+            TechniqueConfig(severity="urgent")
+        with pytest.raises(ValueError, match="exclude_patterns"):
+            TechniqueConfig(exclude_patterns="*.py")
+        
+        technique_config = TechniqueConfig(exclude_patterns=["tests/*"])
+        assert technique_config.exclude_patterns == ("tests/*",)
+        
+        # Pattern lists can't be edited in place, so shared defaults stay intact
+        default = Config().get_technique_config("SAFE-T1101")
+        with pytest.raises(AttributeError):
+            default.exclude_patterns.append("*.py")
+        assert Config().get_technique_config("SAFE-T1001").exclude_patterns == ()
 
 
 class TestConfigLoading:
@@ -74,6 +116,17 @@ class TestConfigLoading:
         assert merged["output"]["format"] == "json"    # Preserved from first
         assert merged["new_option"] == "value"         # Added from second
     
+    def test_merge_configs_technique_entries(self):
+        """Test per-technique settings are merged rather than replaced."""
+        config1 = {"techniques": {"SAFE-T1001": {"severity": "high", "enabled": False}}}
+        config2 = {"techniques": {"SAFE-T1001": {"enabled": True}, "SAFE-T1101": {}}}
+        
+        merged = merge_configs(config1, config2)
+        
+        assert merged["techniques"]["SAFE-T1001"] == {"severity": "high", "enabled": True}
+        assert merged["techniques"]["SAFE-T1101"] == {}
+        assert config1["techniques"]["SAFE-T1001"]["enabled"] is False  # Inputs untouched
+    
     def test_load_config_with_file(self):
         """Test loading configuration from a YAML file."""
         config_content = """
@@ -98,4 +151,90 @@ disabled_techniques:
             assert config.output.format == "sarif"
             assert "SAFE-T1001" in config.disabled_techniques
         finally:
-            config_path.unlink()  # Clean up
\ No newline at end of file
+            config_path.unlink()  # Clean up
+    
+    def test_load_config_cache_invalidation(self, temp_dir):
+        """Test cached configs are independent and reload when the file changes."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("scan:\n  max_file_size: 1000\n")
+        
+        first = load_config(config_path)
+        first.scan.max_file_size = 1
+        
+        second = load_config(config_path)
+        assert second.scan.max_file_size == 1000  # Mutation didn't leak into cache
+        
+        config_path.write_text("scan:\n  max_file_size: 200000\n")
+        third = load_config(config_path)
+        assert third.scan.max_file_size == 200000
+    
+    def test_load_config_environment_snapshot(self, temp_dir, monkeypatch):
+        """Test environment variables are applied from the refreshed snapshot."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("output:\n  format: json\n")
+        
+        monkeypatch.setenv("SAFE_MCP_FAIL_ON_SEVERITY", "high")
+        Config.refresh_env()
+        try:
+            assert load_config(config_path).fail_on_severity == "high"
+        finally:
+            monkeypatch.delenv("SAFE_MCP_FAIL_ON_SEVERITY")
+            Config.refresh_env()
+        
+        assert load_config(config_path).fail_on_severity is None
+    
+    def test_nested_environment_settings(self, temp_dir, monkeypatch):
+        """Test nested scan settings such as the worker count come from the environment."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("scan:\n  max_files: 10\n")
+        
+        monkeypatch.setenv("SAFE_MCP_SCAN__WORKERS", "4")
+        Config.refresh_env()
+        try:
+            config = load_config(config_path)
+            assert config.scan.workers == 4
+            assert config.scan.max_files == 10
+        finally:
+            monkeypatch.delenv("SAFE_MCP_SCAN__WORKERS")
+            Config.refresh_env()
+    
+    def test_find_config_files_explicit_env(self, temp_dir, monkeypatch):
+        """Test SAFE_MCP_CONFIG short-circuits config file discovery."""
+        config_path = temp_dir / "custom.yaml"
+        monkeypatch.setenv("SAFE_MCP_CONFIG", str(config_path))
+        
+        assert find_config_files() == [config_path]
+    
+    def test_load_config_persistent_cache(self, temp_dir, monkeypatch):
+        """Test validated configs are reused across processes via the disk cache."""
+        from safe_mcp_scanner import config as config_module
+        
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("scan:\n  max_files: 10\nplugin_directories: plugins\n")
+        
+        load_config(config_path)
+        config_module._CONFIG_CACHE.clear()  # Simulate a new process
+        monkeypatch.setattr(config_module, "load_yaml_config", pytest.fail)
+        
+        config = load_config(config_path)
+        assert config.scan.max_files == 10
+        assert config.plugin_directories == [Path("plugins")]
+        assert config.model_fields_set == {"scan", "plugin_directories"}
+    
+    def test_load_config_rejects_invalid_disk_cache(self, temp_dir):
+        """Test a corrupt or hand-edited disk cache is rebuilt from the config files."""
+        from safe_mcp_scanner import config as config_module
+        
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("scan:\n  max_files: 10\n")
+        load_config(config_path)
+        
+        cache_file = config_module._config_cache_file()
+        entry = json.loads(cache_file.read_text())
+        entry["state"]["data"]["scan"]["max_files"] = "many"
+        cache_file.write_text(json.dumps(entry))
+        config_module._CONFIG_CACHE.clear()  # Simulate a new process
+        
+        config = load_config(config_path)
+        assert config.scan.max_files == 10
+        assert config.model_fields_set == {"scan"}
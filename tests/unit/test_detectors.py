@@ -0,0 +1,172 @@
+"""Unit tests for detection engines."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from safe_mcp_scanner.config import Config
+from safe_mcp_scanner.detectors import base as detectors_base
+from safe_mcp_scanner.detectors.base import (
+    compute_line_starts, offset_to_line_column, read_file_bytes
+)
+from safe_mcp_scanner.detectors.pattern_matcher import PatternMatcher, _required_literal
+
+
+class TestBaseDetector:
+    """Test shared detector helpers."""
+    
+    def test_read_file_normalizes_encoding_and_newlines(self, default_config, temp_dir):
+        """Test BOM stripping, newline normalization and latin-1 fallback."""
+        matcher = PatternMatcher(default_config)
+        
+        bom_file = temp_dir / "bom.py"
+        bom_file.write_bytes(b"\xef\xbb\xbfimport os\r\nos.system('ls')\r\n")
+        assert matcher.read_file_safely(bom_file) == "import os\nos.system('ls')\n"
+        
+        latin1_file = temp_dir / "latin1.py"
+        latin1_file.write_bytes(b"# caf\xe9\n")
+        assert matcher.read_file_safely(latin1_file) == "# café\n"
+    
+    def test_read_file_enforces_size_limit(self, default_config, temp_dir):
+        """Test files over the configured limit are rejected."""
+        default_config.scan.max_file_size = 10
+        matcher = PatternMatcher(default_config)
+        
+        small_file = temp_dir / "small.py"
+        small_file.write_text("x = 1\n")
+        assert matcher.read_file_safely(small_file) == "x = 1\n"
+        
+        large_file = temp_dir / "large.py"
+        large_file.write_text("x" * 11)
+        with pytest.raises(ValueError, match="too large"):
+            matcher.read_file_safely(large_file)
+    
+    def test_read_file_bytes_beyond_reported_size(self, temp_dir, monkeypatch):
+        """Test files are read in full when their reported size is too small."""
+        # e.g. files still being written, or /proc entries reporting 0 bytes
+        monkeypatch.setattr(
+            detectors_base, "os", SimpleNamespace(fstat=lambda fd: SimpleNamespace(st_size=0))
+        )
+        
+        source_file = temp_dir / "growing.py"
+        source_file.write_bytes(b"x = 1\n" * 4)
+        assert read_file_bytes(source_file, 24) == b"x = 1\n" * 4
+        with pytest.raises(ValueError, match="too large"):
+            read_file_bytes(source_file, 23)
+
+
+def test_offset_to_line_column():
+    """Test offsets map to the same line/column as counting newlines."""
+    content = "first\n\nthird line\nlast"
+    line_starts = compute_line_starts(content)
+    
+    assert line_starts == [0, 6, 7, 18]
+    for offset in range(len(content) + 1):
+        expected_line = content[:offset].count("\n") + 1
+        expected_column = offset - (content.rfind("\n", 0, offset) + 1) + 1
+        assert offset_to_line_column(line_starts, offset) == (expected_line, expected_column)
+
+
+class TestPatternMatcher:
+    """Test regex pattern matching."""
+    
+    def test_overlapping_patterns_all_reported(self, default_config, temp_dir):
+        """Test matches from different patterns at the same location are kept."""
+        matcher = PatternMatcher(default_config)
+        patterns = [
+            {"pattern": r"os\.system\(.*\)", "technique_id": "SAFE-T1101"},
+            {"pattern": r"system", "technique_id": "SAFE-T1101"},
+            {"pattern": r"(['\"])rm\1", "technique_id": "SAFE-T1101"},
+        ]
+        
+        source_file = temp_dir / "tool.py"
+        source_file.write_text("import os\nos.system('rm')\n")
+        findings = matcher.analyze_file(source_file, patterns)
+        assert [f.metadata["pattern"] for f in findings] == [p["pattern"] for p in patterns]
+        
+        # Context for a line is extracted once and shared between findings
+        assert all(f.source_code is findings[0].source_code for f in findings)
+        
+        clean_file = temp_dir / "clean.py"
+        clean_file.write_text("print('hello')\n")
+        assert matcher.analyze_file(clean_file, patterns) == []
+    
+    def test_can_analyze_file_text_detection(self, default_config, temp_dir):
+        """Test text files are accepted and binary or control-heavy files rejected."""
+        matcher = PatternMatcher(default_config)
+        samples = {
+            "source.py": ("print('héllo')\r\n\tpass\n".encode("utf-8"), True),
+            "empty.py": (b"", True),
+            "binary.json": (bytes(range(256)) * 4, False),
+            "controls.js": (b"\x01\x02\x03\x1b" * 100 + b"var x;", False),
+            "archive.json": (b"PK\x03\x04" + b"a" * 200, False),
+            "image.png": (b"plain text", False),
+            "late_nul.js": (b"a" * 2000 + b"\x00" + b"var x;", False),
+        }
+        
+        for name, (data, expected) in samples.items():
+            file_path = temp_dir / name
+            file_path.write_bytes(data)
+            assert matcher.can_analyze_file(file_path) is expected, name
+            assert matcher.can_analyze_bytes(file_path, data) is expected, name
+        
+        # Only the configured number of leading bytes is sniffed
+        config = Config()
+        config.scan.binary_sniff_bytes = 1024
+        late_nul = temp_dir / "late_nul.js"
+        assert PatternMatcher(config).can_analyze_bytes(late_nul, late_nul.read_bytes())
+    
+    def test_compiled_patterns_shared_across_instances(self, default_config):
+        """Test pattern compilation is cached across matcher instances."""
+        pattern_dict = {"pattern": r"eval\s*\("}
+        first = PatternMatcher(default_config)._get_compiled_pattern(pattern_dict)
+        second = PatternMatcher(default_config)._get_compiled_pattern(pattern_dict)
+        assert first is not None and first is second
+        assert PatternMatcher(default_config)._get_compiled_pattern({"pattern": "("}) is None
+    
+    def test_oauth_url_pattern_matches_without_backtracking(self, default_config, temp_dir):
+        """Test the suspicious-URL pattern on real calls and unclosed-call input."""
+        matcher = PatternMatcher(default_config)
+        patterns = matcher.create_oauth_theft_patterns()[:1]
+        
+        source_file = temp_dir / "client.py"
+        source_file.write_text(
+            "requests.post(url,\n    data='https://api.attacker.io/collect')\n"
+            "requests.get('https://example.com/evil')\n"
+        )
+        findings = matcher.analyze_file(source_file, patterns)
+        assert [f.line_number for f in findings] == [1]
+        
+        # Used to take seconds: every quote retried a host scan to end of file
+        pathological = temp_dir / "unclosed.py"
+        pathological.write_text("requests.get('https://host " * 4000)
+        assert matcher.analyze_file(pathological, patterns) == []
+    
+    def test_required_literal_extraction(self):
+        """Test literals are only taken from text every match must contain."""
+        assert _required_literal(r"subprocess\.(call|run)\s*\(", 0) == "subprocess."
+        assert _required_literal(r"shell\s*=\s*True", re.IGNORECASE) == "shell"
+        assert _required_literal(r"abc?def+g", 0) == "def"
+        assert _required_literal(r"x[)(]{2}yz", 0) == "yz"
+        assert _required_literal(r"foo|bar", 0) == ""
+        assert _required_literal(r"(?i)foo", 0) == ""
+    
+    def test_re2_engine_matches_re_engine(self, temp_dir, vulnerable_python_file):
+        """Test findings are the same whichever regex engine is used."""
+        pytest.importorskip("re2")
+        
+        def matched(regex_engine):
+            config = Config()
+            config.scan.regex_engine = regex_engine
+            matcher = PatternMatcher(config)
+            patterns = matcher.create_command_injection_patterns() + [
+                {"pattern": r"(?<=import )os", "technique_id": "SAFE-T1101"},
+            ]
+            return [
+                (f.line_number, f.column_number, f.metadata["matched_text"])
+                for f in matcher.analyze_file(vulnerable_python_file, patterns)
+            ]
+        
+        assert matched("re2") == matched("re")
+        assert matched("re")
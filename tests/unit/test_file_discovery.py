@@ -129,4 +129,66 @@ class TestFileDiscovery:
         assert stats["total_files"] == len(files)
         assert stats["total_size_bytes"] > 0
         assert "categories" in stats
-        assert stats["average_file_size"] > 0
\ No newline at end of file
+        assert stats["average_file_size"] > 0
+    
+    def test_follow_symlinks_handles_directory_loops(self, temp_dir):
+        """Test following symlinked directories terminates on loops."""
+        config = Config()
+        config.scan.follow_symlinks = True
+        
+        package_dir = temp_dir / "pkg"
+        package_dir.mkdir()
+        (package_dir / "tool.py").write_text("print('hello')")
+        (package_dir / "loop").symlink_to(temp_dir, target_is_directory=True)
+        
+        discovery = FileDiscovery(config)
+        files = discovery.discover_files(temp_dir)
+        
+        assert files == [package_dir / "tool.py"]
+    
+    def test_threaded_walk_matches_serial_order(self, temp_dir):
+        """Test listing directories in threads yields files in the serial walk order."""
+        for package in ("alpha", "beta", "gamma"):
+            for module in ("core", "util"):
+                module_dir = temp_dir / package / module
+                module_dir.mkdir(parents=True)
+                (module_dir / "server.py").write_text("print('hello')")
+                (module_dir / "mcp.json").write_text("{}")
+        (temp_dir / "beta" / "node_modules").mkdir()
+        (temp_dir / "beta" / "node_modules" / "dep.js").write_text("")
+        (temp_dir / "gamma" / "loop").symlink_to(temp_dir / "alpha", target_is_directory=True)
+        
+        for follow_symlinks in (False, True):
+            serial_config = Config()
+            serial_config.scan.follow_symlinks = follow_symlinks
+            threaded_config = Config()
+            threaded_config.scan.follow_symlinks = follow_symlinks
+            threaded_config.scan.walk_threads = 4
+            
+            serial_files = FileDiscovery(serial_config).discover_files(temp_dir)
+            threaded_files = FileDiscovery(threaded_config).discover_files(temp_dir)
+            
+            assert len(serial_files) == 12
+            assert threaded_files == serial_files
+    
+    def test_threaded_walk_stops_listing_at_max_files(self, temp_dir, monkeypatch):
+        """Test the threaded walk lists only a bounded number of directories ahead."""
+        for i in range(50):
+            package_dir = temp_dir / f"package_{i:02d}"
+            package_dir.mkdir()
+            (package_dir / "server.py").write_text("print('hello')")
+        
+        listed = []
+        list_directory = FileDiscovery._list_directory
+        
+        def counting_list_directory(self, directory):
+            listed.append(directory)
+            return list_directory(self, directory)
+        
+        monkeypatch.setattr(FileDiscovery, "_list_directory", counting_list_directory)
+        config = Config()
+        config.scan.walk_threads = 2
+        config.scan.max_files = 1
+        
+        assert len(FileDiscovery(config).discover_files(temp_dir)) == 1
+        assert len(listed) <= 1 + 2 * config.scan.walk_threads
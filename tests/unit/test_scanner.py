@@ -1,7 +1,12 @@
 """Unit tests for the main scanner functionality."""
 
-from safe_mcp_scanner.scanner import Scanner
-from safe_mcp_scanner.config import Config
+import json
+from pathlib import Path
+
+from safe_mcp_scanner.scanner import PARALLEL_MIN_FILES, Scanner
+from safe_mcp_scanner.config import Config, TechniqueConfig
+from safe_mcp_scanner.reporters.base import ScanResults
+from safe_mcp_scanner.techniques.base import Finding
 
 
 class TestScanner:
@@ -83,6 +88,20 @@ class TestScanner:
         assert "summary" in json_output
         assert "SAFE-T1101" in json_output  # Should contain our technique
     
+    def test_scan_and_report_outputs(self, default_config, vulnerable_python_file, temp_dir, capsysbinary):
+        """Test scan_and_report writes the same report to stdout and to a file."""
+        scanner = Scanner(default_config)
+        output_file = temp_dir / "report.json"
+        
+        file_results = scanner.scan_and_report(vulnerable_python_file, "json", output_file)
+        stdout_results = scanner.scan_and_report(vulnerable_python_file, "json")
+        
+        file_report = json.loads(output_file.read_bytes())
+        stdout_report = json.loads(capsysbinary.readouterr().out)
+        
+        assert stdout_report["findings"] == file_report["findings"]
+        assert len(file_report["findings"]) == len(file_results.findings) == len(stdout_results.findings)
+    
     def test_scan_with_no_findings(self, default_config, clean_python_file):
         """Test scanning a file with no vulnerabilities."""
         scanner = Scanner(default_config)
@@ -90,4 +109,131 @@ class TestScanner:
         
         # May or may not have findings depending on patterns
         assert results.total_files == 1
-        assert len(results.scanned_files) >= 0
\ No newline at end of file
+        assert len(results.scanned_files) >= 0
+    
+    def test_scan_progress_callback(self, default_config, temp_dir):
+        """Test progress is reported in batches with a concrete total."""
+        for i in range(120):
+            (temp_dir / f"module_{i}.py").write_text("print('hello')")
+        
+        calls = []
+        scanner = Scanner(default_config)
+        scanner.scan(temp_dir, progress_callback=lambda done, total: calls.append((done, total)))
+        
+        assert calls == [(0, 120), (50, 120), (100, 120), (120, 120)]
+    
+    def test_scan_with_worker_processes(self, default_config, temp_dir, vulnerable_python_file):
+        """Test scanning in worker processes matches a serial scan."""
+        # Vary the finding's line so out-of-order merging would show
+        for i in range(PARALLEL_MIN_FILES):
+            padding = "\n" * (i % 7)
+            (temp_dir / f"module_{i}.py").write_text(
+                "import os\n" + padding + 'os.system(f"echo {user_input}")\n'
+            )
+        
+        serial = Scanner(default_config).scan(temp_dir)
+        
+        parallel_config = default_config.model_copy(deep=True)
+        parallel_config.scan.workers = 2
+        parallel_scanner = Scanner(parallel_config)
+        assert parallel_scanner._get_worker_count(PARALLEL_MIN_FILES - 1) == 1
+        assert parallel_scanner._get_worker_count(PARALLEL_MIN_FILES) == 2
+        parallel = parallel_scanner.scan(temp_dir)
+        
+        assert len(serial.findings) >= PARALLEL_MIN_FILES
+        assert parallel.scanned_files == serial.scanned_files
+        assert [
+            (f.file_path, f.line_number, f.metadata["pattern"]) for f in parallel.findings
+        ] == [
+            (f.file_path, f.line_number, f.metadata["pattern"]) for f in serial.findings
+        ]
+    
+    def test_worker_processes_use_parent_techniques(self, default_config, temp_dir):
+        """Test worker processes scan with the techniques enabled on the parent scanner."""
+        for i in range(PARALLEL_MIN_FILES):
+            (temp_dir / f"module_{i}.py").write_text('import os\nos.system(f"echo {user_input}")\n')
+        
+        default_config.scan.workers = 2
+        scanner = Scanner(default_config)
+        command_injection = scanner._techniques.pop("SAFE-T1101")
+        assert scanner.scan(temp_dir).findings == []
+        
+        # Unregistered techniques can't be rebuilt by workers, so the scan stays in-process
+        class UnregisteredTechnique(type(command_injection)):
+            pass
+        
+        scanner._techniques["SAFE-T1101"] = UnregisteredTechnique(default_config)
+        assert not scanner._workers_can_load(scanner.get_enabled_techniques())
+        assert len(scanner.scan(temp_dir).findings) >= PARALLEL_MIN_FILES
+    
+    def test_scan_results_severity_queries(self, temp_dir):
+        """Test severity grouping and threshold checks, including after findings change."""
+        results = ScanResults(
+            findings=[
+                Finding(technique_id="SAFE-T1101", file_path=temp_dir / "a.py", severity="medium"),
+                Finding(technique_id="SAFE-T1001", file_path=temp_dir / "b.json", severity="HIGH"),
+            ],
+            scanned_files=[],
+            total_files=2,
+            scan_duration=0.1
+        )
+        
+        assert results.has_findings_at_severity("any")
+        assert results.has_findings_at_severity("high")
+        assert not results.has_findings_at_severity("critical")
+        assert [len(f) for f in results.get_findings_by_severity().values()] == [0, 1, 1, 0]
+        assert results._get_index() is results._get_index()  # Grouped once until findings change
+        
+        results.findings.append(
+            Finding(technique_id="SAFE-T1101", file_path=temp_dir / "c.py", severity="critical")
+        )
+        assert results.has_findings_at_severity("critical")
+        assert len(results.get_findings_by_technique()["SAFE-T1101"]) == 2
+        
+        # Returned groups are the caller's to modify
+        results.get_findings_by_technique()["SAFE-T1101"].clear()
+        assert len(results.get_findings_by_technique()["SAFE-T1101"]) == 2
+        
+        # Replacing a finding without changing the count is seen too
+        results.findings[2] = Finding(technique_id="SAFE-T1201", file_path=temp_dir / "c.py", severity="low")
+        assert not results.has_findings_at_severity("critical")
+        assert len(results.get_findings_by_technique()["SAFE-T1101"]) == 1
+    
+    def test_file_techniques_indexed_by_suffix(self, default_config):
+        """Test applicable techniques are resolved from the file suffix."""
+        scanner = Scanner(default_config)
+        techniques = scanner.get_enabled_techniques()
+        
+        def applicable(name):
+            return [entry[0] for entry in scanner._get_file_techniques(Path(name), techniques)]
+        
+        assert applicable("server.py") == ["SAFE-T1101"]
+        assert applicable("tools/CONFIG.JSON") == ["SAFE-T1001"]
+        assert applicable("README.md") == []
+    
+    def test_scan_applies_confidence_threshold(self, vulnerable_python_file):
+        """Test findings below a technique's confidence threshold are dropped."""
+        permissive = Scanner(Config(techniques={"SAFE-T1101": TechniqueConfig(confidence_threshold=0.0)}))
+        strict = Scanner(Config(techniques={"SAFE-T1101": TechniqueConfig(confidence_threshold=1.0)}))
+        
+        all_findings = permissive.scan(vulnerable_python_file).findings
+        strict_findings = strict.scan(vulnerable_python_file).findings
+        
+        assert all_findings
+        assert strict_findings == [f for f in all_findings if f.confidence >= 1.0]
+    
+    def test_scan_logs_technique_errors(self, default_config, vulnerable_python_file, monkeypatch, caplog):
+        """Test a failing technique is logged as a warning and the scan continues."""
+        scanner = Scanner(default_config)
+        technique = scanner.get_enabled_techniques()["SAFE-T1101"]
+        
+        def fail(file_path, data):
+            raise RuntimeError("boom")
+        
+        monkeypatch.setattr(technique, "analyze_bytes", fail)
+        
+        with caplog.at_level("WARNING", logger="safe_mcp_scanner"):
+            results = scanner.scan(vulnerable_python_file)
+        
+        assert results.findings == []
+        assert "with SAFE-T1101: boom" in caplog.text
@@ -0,0 +1,22 @@
+"""Unit tests for JSON serialization helpers."""
+
+import io
+
+from safe_mcp_scanner.serialization import dumps_json, write_json
+
+
+def test_write_json_streams_iterators_like_dumps_json():
+    """Test streamed output is identical to serializing the materialized data."""
+    data = {
+        "summary": {"total": 2, "by_severity": {"high": 1}, "empty": []},
+        "findings": [{"message": "naïve\nmatch", "groups": [1, 2]}, {"metadata": {}}],
+        "files_scanned": [],
+    }
+    
+    streamed = dict(data)
+    streamed["findings"] = iter(data["findings"])
+    streamed["files_scanned"] = iter(data["files_scanned"])
+    
+    stream = io.BytesIO()
+    write_json(stream, streamed)
+    assert stream.getvalue() == dumps_json(data)
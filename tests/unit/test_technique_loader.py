@@ -0,0 +1,60 @@
+"""Unit tests for technique loading."""
+
+import pytest
+
+from safe_mcp_scanner.config import Config
+from safe_mcp_scanner.technique_loader import TechniqueLoader
+from safe_mcp_scanner.techniques import TECHNIQUE_REGISTRY
+
+
+PLUGIN_SOURCE = '''
+from typing import List
+
+from safe_mcp_scanner.techniques.base import BaseTechnique, register_technique
+
+
+@register_technique
+class CustomTechnique(BaseTechnique):
+    technique_id = "SAFE-T9001"
+    name = "Custom"
+    description = "Custom plugin technique"
+    severity = "low"
+    tactic = "Execution"
+    mitre_attack_mapping = "T1059"
+    file_types: List[str] = [".py"]
+
+    def analyze_file(self, file_path):
+        return []
+'''
+
+
+@pytest.fixture
+def restore_registry():
+    """Remove techniques registered by a test from the global registry."""
+    registered = dict(TECHNIQUE_REGISTRY)
+    yield
+    TECHNIQUE_REGISTRY.clear()
+    TECHNIQUE_REGISTRY.update(registered)
+
+
+class TestTechniqueLoader:
+    """Test loading built-in and custom techniques."""
+    
+    def test_load_custom_techniques(self, temp_dir, restore_registry):
+        """Test plugin modules register techniques alongside the built-ins."""
+        plugin_dir = temp_dir / "plugins"
+        plugin_dir.mkdir()
+        (plugin_dir / "custom.py").write_text(PLUGIN_SOURCE)
+        (plugin_dir / "helpers.py").write_text("VALUE = 1\n")
+        (plugin_dir / "_private.py").write_text("raise RuntimeError('not loaded')\n")
+        
+        techniques = TechniqueLoader(Config(plugin_directories=[plugin_dir])).load_techniques()
+        
+        assert {"SAFE-T1001", "SAFE-T1101", "SAFE-T9001"} <= set(techniques)
+        assert techniques["SAFE-T9001"].name == "Custom"
+    
+    def test_load_techniques_without_plugins(self, temp_dir):
+        """Test an empty or missing plugin directory loads only the built-ins."""
+        config = Config(plugin_directories=[temp_dir, temp_dir / "missing"])
+        
+        assert set(TechniqueLoader(config).load_techniques()) == {"SAFE-T1001", "SAFE-T1101"}
@@ -1,9 +1,11 @@
 """Unit tests for SAFE-MCP techniques."""
 
+import pickle
 import pytest
 from pathlib import Path
 
 from safe_mcp_scanner.config import Config
+from safe_mcp_scanner.techniques.base import Finding
 from safe_mcp_scanner.techniques.command_injection import CommandInjectionTechnique
 from safe_mcp_scanner.techniques.malicious_tools import MaliciousToolTechnique
 
@@ -53,6 +55,26 @@ class TestCommandInjectionTechnique:
         
         # Should have minimal or no findings
         assert len(findings) == 0
+    
+    def test_analyze_bytes_matches_analyze_file(self, default_config, vulnerable_python_file):
+        """Test analyzing already-read contents gives the same findings."""
+        technique = CommandInjectionTechnique(default_config)
+        from_file = technique.analyze_file(vulnerable_python_file)
+        from_bytes = technique.analyze_bytes(vulnerable_python_file, vulnerable_python_file.read_bytes())
+        
+        assert from_bytes == from_file
+        assert technique.analyze_bytes(vulnerable_python_file, b"\x00\x01binary") == []
+    
+    def test_patterns_built_once(self, default_config, vulnerable_python_file, monkeypatch):
+        """Test detection patterns are built at construction, not per file."""
+        technique = CommandInjectionTechnique(default_config)
+        
+        def fail():
+            raise AssertionError("patterns rebuilt during analysis")
+        
+        monkeypatch.setattr(technique.pattern_matcher, "create_command_injection_patterns", fail)
+        
+        assert len(technique.analyze_file(vulnerable_python_file)) > 0
 
 
 class TestMaliciousToolTechnique:
@@ -89,4 +111,17 @@ class TestMaliciousToolTechnique:
             assert finding.technique_id == "SAFE-T1001"
             assert finding.severity == "high"
             assert finding.file_path == malicious_mcp_config
-            assert "MCP" in finding.recommendation
\ No newline at end of file
+            assert "MCP" in finding.recommendation
+
+
+class TestFinding:
+    """Test the finding record."""
+    
+    def test_finding_defaults_and_pickling(self):
+        """Test findings get their own metadata and survive pickling for worker processes."""
+        first = Finding(technique_id="SAFE-T1101", file_path=Path("a.py"))
+        second = Finding(technique_id="SAFE-T1101", file_path=Path("b.py"))
+        first.metadata["pattern"] = "shell"
+        
+        assert second.metadata == {}
+        assert pickle.loads(pickle.dumps(first)) == first